@@ -6,6 +6,7 @@ Helps determine which camera position provides the best visibility
 
 import os
 from ollama_vision_analyzer import OllamaVisionAnalyzer
+from sweep_manifest import sweep_renders
 
 def analyze_camera_tests():
     """Analyze all camera test renders to find the best position"""
@@ -63,22 +64,19 @@ def analyze_camera_tests():
     BE BRUTALLY HONEST. This will determine the final camera position for 100% success.
     """
     
-    # Get all test renders
-    test_files = [f for f in os.listdir(camera_tests_dir) if f.endswith('.png')]
+    # Get all test renders; the sweep's manifest maps numbered frames to view names
+    test_renders = sweep_renders(camera_tests_dir, 'camera_test_')
     
-    if not test_files:
+    if not test_renders:
         print("❌ No test renders found")
         return
     
-    print(f"🔍 Analyzing {len(test_files)} camera test renders...")
+    print(f"🔍 Analyzing {len(test_renders)} camera test renders...")
     print("=" * 80)
     
     results = []
     
-    for test_file in sorted(test_files):
-        test_path = os.path.join(camera_tests_dir, test_file)
-        test_name = test_file.replace('camera_test_', '').replace('.png', '')
-        
+    for test_name, test_path in test_renders:
         print(f"\n📷 Analyzing: {test_name}")
         print("-" * 40)
         
@@ -6,6 +6,7 @@ Uses Ollama to analyze camera framing tests and determine the best camera positi
 
 import os
 from ollama_vision_analyzer import OllamaVisionAnalyzer
+from sweep_manifest import sweep_renders
 
 def analyze_framing_tests():
     """Analyze all framing test renders to find the best camera position"""
@@ -77,19 +78,17 @@ def analyze_framing_tests():
     BE BRUTALLY HONEST. This will determine the final camera position for 100% success.
     """
     
-    # Get all framing test renders
-    test_files = [f for f in os.listdir(framing_tests_dir) if f.endswith('.png')]
-    if not test_files:
+    # Get all framing test renders; the sweep's manifest maps numbered frames to view names
+    test_renders = sweep_renders(framing_tests_dir, 'framing_test_')
+    if not test_renders:
         print("❌ No framing test renders found")
         return
     
-    print(f"🔍 Analyzing {len(test_files)} framing test renders...")
+    print(f"🔍 Analyzing {len(test_renders)} framing test renders...")
     print("=" * 80)
     
     results = []
-    for test_file in sorted(test_files):
-        test_path = os.path.join(framing_tests_dir, test_file)
-        test_name = test_file.replace('framing_test_', '').replace('.png', '')
+    for test_name, test_path in test_renders:
         
         print(f"\n📷 Analyzing: {test_name}")
         print("-" * 40)
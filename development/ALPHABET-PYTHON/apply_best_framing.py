@@ -1,76 +1,45 @@
 #!/usr/bin/env python3
 """
-Apply Best Framing Position to Main Render Script
-Automatically updates ultimate_cascade_render.py with the optimal camera framing
+Apply Best Framing Position to Main Render Spec
+Automatically updates scene_specs/ultimate_cascade.json with the optimal camera framing
 """
 
 import os
-import re
+import sys
 
-def apply_framing_settings(framing_position):
-    """Apply the best framing position to the main render script"""
-    
-    # Framing position mappings based on analysis results
-    framing_settings = {
-        "dynamic_left": {
-            "location": "(-15, -45, 30)",
-            "rotation": "(math.radians(30), math.radians(10), 0)",
-            "lens": "35",
-            "focus": "45.0"
-        }
-    }
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_spec import find_view, load_spec, save_spec, with_camera
+
+def apply_framing_settings(framing_position, target="ultimate_cascade"):
+    """Apply the best framing position to the main render spec"""
     
-    if framing_position not in framing_settings:
+    # Framing positions come from the framing test sweep
+    settings = find_view(load_spec("framing_test"), framing_position)
+    if settings is None:
         print(f"❌ Unknown framing position: {framing_position}")
         return False
     
-    settings = framing_settings[framing_position]
-    
-    # Read the main script
-    script_path = "ultimate_cascade_render.py"
-    if not os.path.exists(script_path):
-        print(f"❌ Main script not found: {script_path}")
+    # Read the main spec
+    try:
+        spec = load_spec(target)
+    except OSError as e:
+        print(f"❌ Main spec not found: {e}")
         return False
     
-    with open(script_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Update camera location
-    content = re.sub(
-        r'bpy\.ops\.object\.camera_add\(location=\([^)]+\), rotation=\([^)]+\)\)',
-        f'bpy.ops.object.camera_add(location={settings["location"]}, rotation={settings["rotation"]})',
-        content
-    )
+    # Update camera location, rotation, lens and focus distance
+    path = save_spec(with_camera(spec, settings), target)
     
-    # Update camera lens
-    content = re.sub(
-        r'camera\.data\.lens = \d+',
-        f'camera.data.lens = {settings["lens"]}',
-        content
-    )
-    
-    # Update focus distance
-    content = re.sub(
-        r'camera\.data\.dof\.focus_distance = \d+\.\d+',
-        f'camera.data.dof.focus_distance = {settings["focus"]}',
-        content
-    )
-    
-    # Write the updated script
-    with open(script_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"✅ Successfully applied framing position: {framing_position}")
-    print(f"   Location: {settings['location']}")
-    print(f"   Rotation: {settings['rotation']}")
+    print(f"✅ Successfully applied framing position: {framing_position} -> {path}")
+    print(f"   Location: {tuple(settings['location'])}")
+    print(f"   Rotation: {tuple(settings['rotation'])} degrees")
     print(f"   Lens: {settings['lens']}")
-    print(f"   Focus: {settings['focus']}")
+    print(f"   Focus: {settings['focus_distance']}")
     
     return True
 
 def main():
     """Main function"""
-    print("🔧 Apply Best Framing Position to Main Render Script")
+    print("🔧 Apply Best Framing Position to Main Render Spec")
     print("=" * 60)
     
     # Based on framing analysis, dynamic_left achieved the highest score (8/10)
@@ -87,4 +56,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
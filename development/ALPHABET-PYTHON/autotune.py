@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Autotune
+Fits samples, resolution and denoising to a wall-clock budget from a per-host calibration render
+"""
+
+import json
+import os
+import socket
+import time
+
+import bpy
+
+from cycles_sampling import select_denoiser
+from scene_spec import SCRIPT_DIR, UNRENDERED_SECTIONS, save_json, spec_hash
+
+AUTOTUNE_DIR = os.path.join(SCRIPT_DIR, "cache", "autotune")
+
+# Calibration renders: one warm-up to sync the scene, then two sample counts at a small size
+CALIBRATION_SIZE = (320, 180)
+CALIBRATION_SAMPLES = (4, 16)
+
+# Fewest samples worth rendering before the resolution drops instead
+MIN_SAMPLES = {'CYCLES': 16}
+MIN_TAA_SAMPLES = 8
+
+# Resolution percentages tried, largest first
+SCALES = (1.0, 0.75, 0.5, 0.25)
+
+# Share of the budget planned for rendering; the rest absorbs denoising and estimate error
+SAFETY = 0.85
+
+
+def sample_setting(scene):
+    """(owner, attribute) holding the sample count for the scene's engine"""
+    if scene.render.engine == 'CYCLES':
+        return scene.cycles, 'samples'
+    return scene.eevee, 'taa_render_samples'
+
+
+def calibration_path():
+    return os.path.join(AUTOTUNE_DIR, f"{socket.gethostname()}.json")
+
+
+def load_calibrations():
+    try:
+        with open(calibration_path(), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_calibrations(calibrations):
+    save_json(calibration_path(), calibrations)
+
+
+def calibration_key(spec, scene):
+    """Scene sections only, so a new camera from the camera tests or another output keeps the calibration"""
+    scene_hash = spec_hash(spec, exclude=UNRENDERED_SECTIONS)[:16]
+    return f"{spec.get('name', 'scene')}|{scene.render.engine}|{scene_hash}|{bpy.app.version_string}"
+
+
+def calibrate(scene):
+    """Scene sync, fixed per-render overhead and seconds per sample per megapixel on this machine"""
+    print("⏱️ [Autotune] Calibrating...")
+    render = scene.render
+    owner, attr = sample_setting(scene)
+    saved = {'resolution_x': render.resolution_x, 'resolution_y': render.resolution_y,
+             'resolution_percentage': render.resolution_percentage, 'use_persistent_data': render.use_persistent_data}
+    saved_samples = getattr(owner, attr)
+    # Adaptive sampling would stop early and hide the per-sample cost
+    adaptive = scene.cycles.use_adaptive_sampling if render.engine == 'CYCLES' else None
+    if adaptive:
+        scene.cycles.use_adaptive_sampling = False
+
+    render.resolution_x, render.resolution_y = CALIBRATION_SIZE
+    render.resolution_percentage = 100
+    render.use_persistent_data = True
+    times = []
+    for samples in (CALIBRATION_SAMPLES[0],) + CALIBRATION_SAMPLES:
+        setattr(owner, attr, samples)
+        start = time.perf_counter()
+        bpy.ops.render.render()
+        times.append(time.perf_counter() - start)
+
+    for key, value in saved.items():
+        setattr(render, key, value)
+    setattr(owner, attr, saved_samples)
+    if adaptive:
+        scene.cycles.use_adaptive_sampling = True
+
+    warmup, low_time, high_time = times
+    low, high = CALIBRATION_SAMPLES
+    megapixels = CALIBRATION_SIZE[0] * CALIBRATION_SIZE[1] / 1e6
+    per_sample = max((high_time - low_time) / (high - low), 1e-6)
+    return {
+        'sync': max(warmup - low_time, 0.0),
+        'overhead': max(low_time - low * per_sample, 0.0),
+        'per_sample_megapixel': per_sample / megapixels,
+    }
+
+
+def predict(calibration, megapixels, samples):
+    return calibration['sync'] + calibration['overhead'] + calibration['per_sample_megapixel'] * megapixels * samples
+
+
+def choose(calibration, budget, megapixels, max_samples, min_samples):
+    """Largest resolution scale, then most samples, that fit the budget"""
+    available = budget * SAFETY - calibration['sync'] - calibration['overhead']
+    for scale in SCALES:
+        samples = int(available / (calibration['per_sample_megapixel'] * megapixels * scale * scale))
+        if samples >= min_samples:
+            return scale, min(samples, max_samples)
+    return SCALES[-1], min_samples
+
+
+def autotune(scene, spec, budget):
+    """Set samples, resolution percentage and denoiser so the next render fits in budget seconds"""
+    calibrations = load_calibrations()
+    key = calibration_key(spec, scene)
+    calibration = calibrations.get(key)
+    if calibration is None:
+        calibration = calibrate(scene)
+        calibrations[key] = calibration
+        save_calibrations(calibrations)
+    else:
+        print(f"⏱️ [Autotune] Using calibration for {socket.gethostname()}")
+
+    render = scene.render
+    owner, attr = sample_setting(scene)
+    cycles = render.engine == 'CYCLES'
+    megapixels = render.resolution_x * render.resolution_y * (render.resolution_percentage / 100) ** 2 / 1e6
+    scale, samples = choose(calibration, budget, megapixels, getattr(owner, attr),
+                            MIN_SAMPLES.get(render.engine, MIN_TAA_SAMPLES))
+    render.resolution_percentage = max(1, round(render.resolution_percentage * scale))
+    setattr(owner, attr, samples)
+
+    denoiser = "none"
+    if cycles:
+        # Under a budget a denoised low-sample image beats a noisy one
+        scene.cycles.use_denoising = True
+        denoiser = select_denoiser(scene)
+        if hasattr(scene.cycles, 'time_limit'):
+            # Hard stop in case the estimate is off; adaptive sampling may finish sooner
+            scene.cycles.time_limit = max(budget * SAFETY - calibration['sync'], 1.0)
+
+    predicted = predict(calibration, megapixels * scale * scale, samples)
+    width = round(render.resolution_x * render.resolution_percentage / 100)
+    height = round(render.resolution_y * render.resolution_percentage / 100)
+    print(f"⏱️ [Autotune] {budget:.0f}s budget -> {width}x{height}, {samples} samples, denoiser {denoiser} "
+          f"(predicted {predicted:.1f}s)")
+    return {'scale': scale, 'samples': samples, 'predicted': predicted}
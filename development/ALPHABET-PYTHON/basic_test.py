@@ -4,13 +4,15 @@ Very basic test to identify rendering issues
 """
 
 import bpy
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_reset import reset_scene
 
 def clear_scene():
     """Clear everything"""
-    print("🧹 Clearing scene...")
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
-    print("✅ Scene cleared")
+    reset_scene()
 
 def setup_basic_render():
     """Setup basic render"""
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Camera Batch
+Renders many camera views of one compiled scene in a single session with persistent render data
+"""
+
+import os
+import time
+
+import bpy
+
+from eevee_quality import FITTED_KEYS
+from lod import apply_lod, casts_shadow
+from render_cache import render_key, steering_key
+from scene_spec import item_digest
+
+
+def sweep_cameras(compiler, shots, context=()):
+    """Create every shot's camera, with one LOD and settings fit across them and the context camera specs"""
+    scene = bpy.context.scene
+    # Keep the synced scene and BVH between renders; only the active camera changes per view
+    scene.render.use_persistent_data = True
+
+    cameras = [compiler.setup_camera(shot[0], lod=False) for shot in shots]
+    # The rest of the sweep steers LOD and settings too, so every shard resolves them the same way
+    steering = [compiler.setup_camera(camera_spec, lod=False) for camera_spec in context]
+    if compiler.spec.get('lod', True):
+        # One LOD pass for the whole sweep: geometry swaps between views would force a full re-sync
+        apply_lod(compiler.builder, cameras=cameras + steering)
+    compiler.fit_render_settings(cameras=cameras + steering)
+    for camera in steering:
+        compiler.builder.remove_object(camera)
+    return cameras
+
+
+def resolved_state(scene=None):
+    """Digest of what LOD and the EEVEE fit resolved to: pooled mesh levels and shadows, fitted settings, sun reach"""
+    scene = scene if scene is not None else bpy.context.scene
+    objects = sorted([obj.name, obj.get("lod_segments"), casts_shadow(obj)] for obj in scene.objects
+                     if obj.get("primitive") is not None and obj.type == 'MESH')
+    eevee = {}
+    if 'EEVEE' in scene.render.engine:
+        eevee = {key: getattr(scene.eevee, key) for key in FITTED_KEYS if hasattr(scene.eevee, key)}
+        eevee['gtao_distance'] = round(eevee.get('gtao_distance', 0.0), 5)
+    suns = sorted([light.name, round(light.shadow_cascade_max_distance, 3)] for light in bpy.data.lights
+                  if light.type == 'SUN' and hasattr(light, 'shadow_cascade_max_distance'))
+    return item_digest(objects, eevee, suns)
+
+
+def frame_runs(frames):
+    """Sorted frame numbers as (first, last) runs of consecutive frames"""
+    runs = []
+    for frame in sorted(frames):
+        if runs and frame == runs[-1][1] + 1:
+            runs[-1][1] = frame
+        else:
+            runs.append([frame, frame])
+    return [tuple(run) for run in runs]
+
+
+def render_camera_batch(compiler, shots, context=(), cameras=None):
+    """Render (camera_spec, output_path) pairs, with their cameras when already set up; returns per-view timings"""
+    scene = bpy.context.scene
+    cameras = cameras if cameras is not None else sweep_cameras(compiler, shots, context)
+
+    print(f"🎥 [Batch] Rendering {len(shots)} views...")
+    timings = []
+    start = time.perf_counter()
+    for camera, (_, output_path, *_) in zip(cameras, shots):
+        scene.camera = camera
+        scene.render.filepath = output_path
+        view_start = time.perf_counter()
+        bpy.ops.render.render(write_still=True)
+        timings.append({'name': camera.name, 'path': output_path, 'seconds': time.perf_counter() - view_start})
+        print(f"   {camera.name}: {timings[-1]['seconds']:.1f}s -> {output_path}")
+    total = time.perf_counter() - start
+
+    for camera in cameras:
+        compiler.builder.remove_object(camera)
+    if timings:
+        rest = timings[1:]
+        average = sum(t['seconds'] for t in rest) / len(rest) if rest else 0.0
+        print(f"✅ {len(timings)} views in {total:.1f}s (first view with scene sync {timings[0]['seconds']:.1f}s, "
+              f"then {average:.1f}s per view)")
+    return timings
+
+
+def render_camera_animation(compiler, shots, pattern, context=(), cameras=None):
+    """Render (camera_spec, output_path, frame) shots as one animation; a timeline marker binds each frame's camera"""
+    scene = bpy.context.scene
+    cameras = cameras if cameras is not None else sweep_cameras(compiler, shots, context)
+    # The cameras are removed before the timings are built; removed datablocks raise on access
+    names = [camera.name for camera in cameras]
+    saved = (scene.frame_start, scene.frame_end, scene.frame_current, scene.render.filepath, scene.camera)
+
+    markers = []
+    for camera, (_, _, frame) in zip(cameras, shots):
+        marker = scene.timeline_markers.new(camera.name, frame=frame)
+        marker.camera = camera
+        markers.append(marker)
+    scene.camera = cameras[0]
+    scene.render.filepath = pattern
+
+    started, written = {}, {}
+
+    def frame_written(render_scene, *args):
+        written[render_scene.frame_current] = time.perf_counter()
+
+    bpy.app.handlers.render_write.append(frame_written)
+    runs = frame_runs(shot[2] for shot in shots)
+    print(f"🎞️ [Animation] Rendering {len(shots)} views as frames "
+          f"{', '.join(f'{first}-{last}' for first, last in runs)} -> {pattern}")
+    start = time.perf_counter()
+    try:
+        # Cached views leave gaps; each run of missing frames is one animation render
+        for first, last in runs:
+            scene.frame_start, scene.frame_end = first, last
+            started[first] = time.perf_counter()
+            bpy.ops.render.render(animation=True)
+        frame_paths = {frame: scene.render.frame_path(frame=frame) for frame in written}
+    finally:
+        bpy.app.handlers.render_write.remove(frame_written)
+        for marker in markers:
+            scene.timeline_markers.remove(marker)
+        scene.frame_start, scene.frame_end, scene.frame_current, scene.render.filepath, scene.camera = saved
+        for camera in cameras:
+            compiler.builder.remove_object(camera)
+    total = time.perf_counter() - start
+
+    timings = []
+    for name, (_, output_path, frame) in zip(names, shots):
+        if frame not in written:
+            print(f"⚠️ Frame {frame} ({name}) was not written")
+            continue
+        # Blender may pick its own extension for the output format; keep the manifest's name
+        if frame_paths[frame] != output_path and os.path.exists(frame_paths[frame]):
+            os.replace(frame_paths[frame], output_path)
+        # Measured from the last frame written in the same run, or the run's start; a failed frame in between
+        # is charged to the next one
+        first = next(first for first, last in runs if first <= frame <= last)
+        previous = max([started[first]] + [written[f] for f in range(first, frame) if f in written])
+        timings.append({'name': name, 'path': output_path, 'frame': frame, 'seconds': written[frame] - previous})
+    print(f"✅ {len(timings)} frames in {total:.1f}s")
+    return timings
+
+
+def render_cached_batch(spec, shots, tier, render_cache, prepare, pattern=None, context=()):
+    """Serve cached views and render the rest, as animation frames given a pattern; context camera specs steer
+    LOD and settings without rendering. prepare() runs only when the resolved state is unknown or a view misses"""
+    version = bpy.app.version_string
+    # Views are keyed on what LOD and the EEVEE fit resolved to, not on which views shared the batch, so
+    # resharded sweeps, the optimizer and repeated runs reuse each other's frames whenever the pixels match
+    steering = steering_key(spec, [shot[0] for shot in shots] + list(context), tier, version)
+    state = render_cache.fetch_state(steering)
+    compiler = cameras = None
+    if state is None:
+        compiler = prepare()
+        cameras = sweep_cameras(compiler, shots, context)
+        state = resolved_state()
+        render_cache.store_state(steering, state)
+
+    keyed = [(shot, render_key(spec, shot[0], tier, version, state=state)) for shot in shots]
+    misses = [(shot, key) for shot, key in keyed if not render_cache.fetch(key, shot[1])]
+    missed_paths = {shot[1] for shot, _ in misses}
+    hits = [{'path': shot[1], 'seconds': None, 'cached': True} for shot in shots if shot[1] not in missed_paths]
+    timings = []
+    if misses:
+        if cameras is None:
+            compiler = prepare()
+            cameras = sweep_cameras(compiler, shots, context)
+        missed_shots = [shot for shot, _ in misses]
+        missed_cameras = [camera for camera, shot in zip(cameras, shots) if shot[1] in missed_paths]
+        for camera, shot in zip(cameras, shots):
+            if shot[1] not in missed_paths:
+                compiler.builder.remove_object(camera)
+        if pattern:
+            timings = render_camera_animation(compiler, missed_shots, pattern, cameras=missed_cameras)
+        else:
+            timings = render_camera_batch(compiler, missed_shots, cameras=missed_cameras)
+        # A view that was not written would cache whatever an earlier run left at its path
+        written = {timing['path'] for timing in timings}
+        for shot, key in misses:
+            if shot[1] in written:
+                render_cache.store(key, shot[1])
+    elif cameras is not None:
+        for camera in cameras:
+            compiler.builder.remove_object(camera)
+    render_cache.report()
+    # Cached views carry no seconds; views that failed to write are absent, and the manifest marks them failed
+    return hits + timings
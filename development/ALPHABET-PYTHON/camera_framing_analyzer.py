@@ -5,8 +5,21 @@ Comprehensive camera positioning and framing analysis for 100% success
 """
 
 import bpy
-import math
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_cache import SceneCache
+from scene_compiler import SceneCompiler
+from scene_reset import reset_scene
+from camera_batch import render_camera_animation, render_cached_batch
+from camera_optimizer import optimize_views
+from framing_score import framing_subjects, print_scores, score_views
+from quality_tiers import tier_arg
+from render_cache import RenderCache
+from render_preset import script_args, script_option
+from scene_spec import context_cameras, load_spec, view_camera
+from sweep_manifest import MANIFEST_NAME, frame_output, write_manifest
 
 class CameraFramingAnalyzer:
     def __init__(self):
@@ -15,6 +28,20 @@ class CameraFramingAnalyzer:
             "references_and_renders", "framing_tests"
         )
         os.makedirs(self.output_dir, exist_ok=True)
+        # Test scene and framing positions live in scene_specs/framing_test.json
+        self.spec = load_spec("framing_test")
+        # Sweeps render at the draft tier unless '-- --tier NAME' asks for another
+        self.tier = tier_arg(script_args())
+        self.compiler = SceneCompiler(self.spec, tier=self.tier)
+        self.scene_cache = SceneCache()
+        self.render_cache = RenderCache()
+        # '-- --views a,b' renders one shard of a sharded sweep; frames keep their full-list numbers
+        selected = script_option('--views')
+        self.views = [view for view in self.spec['views'] if not selected or view['name'] in selected.split(',')]
+        self.manifest_name = script_option('--manifest', MANIFEST_NAME)
+        # One animation frame per view, in spec order; manifest.json maps frames back to view names
+        self.frame_pattern = os.path.join(self.output_dir, "framing_test_####.png")
+        self.timings = []
         self.best_framing = None
         self.best_score = 0
         
@@ -22,222 +49,40 @@ class CameraFramingAnalyzer:
         """Create a comprehensive test scene with all elements"""
         print("🎬 Setting up comprehensive test scene...")
         
-        # Clear scene
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
-        
-        # Create materials
-        materials = {
-            'red': self.create_material("Red", (1.0, 0.0, 0.0)),
-            'pink': self.create_material("Pink", (1.0, 0.2, 0.8)),
-            'green': self.create_material("Green", (0.0, 1.0, 0.0)),
-            'water': self.create_material("Water", (0.2, 0.6, 0.9)),
-            'rock': self.create_material("Rock", (0.5, 0.5, 0.5)),
-            'pagoda': self.create_material("Pagoda", (0.8, 0.6, 0.4)),
-            'vegetation': self.create_material("Vegetation", (0.1, 0.6, 0.1)),
-            'cloud': self.create_material("Cloud", (0.9, 0.7, 0.8)),
-        }
-        
-        # Create characters (A, B, C) - PERFECTLY positioned
-        self.create_test_character('A', (-20, -25, 12), materials['red'], scale=8.0)
-        self.create_test_character('B', (0, -25, 12), materials['pink'], scale=8.0)
-        self.create_test_character('C', (20, -25, 12), materials['green'], scale=8.0)
-        
-        # Create waterfall - PROMINENT and visible
-        self.create_waterfall((-10, -15, 10), materials['water'])
-        
-        # Create pagoda - VISIBLE and prominent
-        self.create_pagoda((10, -15, 5), materials['pagoda'])
-        
-        # Create environment elements
-        self.create_ground(materials['rock'])
-        self.create_trees(materials['vegetation'])
-        self.create_clouds(materials['cloud'])
-        
-        # Setup lighting
-        self.setup_lighting()
-        print("✅ Comprehensive test scene created.")
-        
-    def create_material(self, name, color):
-        mat = bpy.data.materials.new(name)
-        mat.use_nodes = False
-        mat.diffuse_color = (*color[:3], 1.0)
-        return mat
-        
-    def create_test_character(self, letter, pos, material, scale=1.0):
-        """Create a comprehensive test character with all features"""
-        # Main body
-        bpy.ops.mesh.primitive_cube_add(location=pos, scale=(scale, scale, scale))
-        obj = bpy.context.active_object
-        obj.name = f"{letter}_Body"
-        obj.data.materials.append(material)
-        
-        # Eyes - VISIBLE
-        bpy.ops.mesh.primitive_uv_sphere_add(location=(pos[0] - 0.5, pos[1] + 0.5, pos[2] + 0.5), scale=(0.3, 0.3, 0.3))
-        eye = bpy.context.active_object
-        eye.name = f"{letter}_Eye1"
-        eye.data.materials.append(self.create_material("White", (1.0, 1.0, 1.0)))
-        
-        bpy.ops.mesh.primitive_uv_sphere_add(location=(pos[0] + 0.5, pos[1] + 0.5, pos[2] + 0.5), scale=(0.3, 0.3, 0.3))
-        eye = bpy.context.active_object
-        eye.name = f"{letter}_Eye2"
-        eye.data.materials.append(self.create_material("White", (1.0, 1.0, 1.0)))
-        
-        # Mouth - LARGE and VISIBLE
-        bpy.ops.mesh.primitive_cube_add(location=(pos[0], pos[1] + 0.3, pos[2] + 0.2), scale=(0.8, 0.4, 0.2))
-        mouth = bpy.context.active_object
-        mouth.name = f"{letter}_Mouth"
-        mouth.data.materials.append(self.create_material("Black", (0.0, 0.0, 0.0)))
-        
-        # Limbs - VISIBLE
-        bpy.ops.mesh.primitive_cylinder_add(location=(pos[0] - 1.5, pos[1], pos[2]), scale=(0.2, 0.2, 1.5))
-        arm = bpy.context.active_object
-        arm.name = f"{letter}_Arm1"
-        arm.data.materials.append(self.create_material("Black", (0.0, 0.0, 0.0)))
-        
-        bpy.ops.mesh.primitive_cylinder_add(location=(pos[0] + 1.5, pos[1], pos[2]), scale=(0.2, 0.2, 1.5))
-        arm = bpy.context.active_object
-        arm.name = f"{letter}_Arm2"
-        arm.data.materials.append(self.create_material("Black", (0.0, 0.0, 0.0)))
-        
-    def create_waterfall(self, pos, material):
-        """Create a prominent waterfall"""
-        # Main waterfall
-        bpy.ops.mesh.primitive_plane_add(location=pos, scale=(15, 2, 15))
-        waterfall = bpy.context.active_object
-        waterfall.name = "Waterfall"
-        waterfall.rotation_euler = (math.radians(90), 0, 0)
-        waterfall.data.materials.append(material)
-        
-        # Water pool
-        bpy.ops.mesh.primitive_plane_add(location=(pos[0], pos[1] - 5, -1), scale=(20, 20, 1))
-        pool = bpy.context.active_object
-        pool.name = "WaterPool"
-        pool.data.materials.append(material)
-        
-    def create_pagoda(self, pos, material):
-        """Create a visible pagoda"""
-        # Main building
-        bpy.ops.mesh.primitive_cube_add(location=pos, scale=(3, 2, 4))
-        pagoda = bpy.context.active_object
-        pagoda.name = "PagodaMain"
-        pagoda.data.materials.append(material)
-        
-        # Roof
-        bpy.ops.mesh.primitive_cube_add(location=(pos[0], pos[1], pos[2] + 3), scale=(3.5, 2.5, 1))
-        roof = bpy.context.active_object
-        roof.name = "PagodaRoof"
-        roof.data.materials.append(material)
-        
-    def create_ground(self, material):
-        """Create ground plane"""
-        bpy.ops.mesh.primitive_plane_add(location=(0, 0, -2), scale=(50, 50, 1))
-        ground = bpy.context.active_object
-        ground.name = "Ground"
-        ground.data.materials.append(material)
-        
-    def create_trees(self, material):
-        """Create visible trees"""
-        for i in range(6):
-            x = (i - 2.5) * 8
-            bpy.ops.mesh.primitive_cylinder_add(location=(x, -30, 0), scale=(1, 1, 6))
-            tree = bpy.context.active_object
-            tree.name = f"Tree_{i}"
-            tree.data.materials.append(material)
-            
-    def create_clouds(self, material):
-        """Create visible clouds"""
-        for i in range(5):
-            x = (i - 2) * 10
-            bpy.ops.mesh.primitive_uv_sphere_add(location=(x, -10, 20), scale=(3, 2, 1))
-            cloud = bpy.context.active_object
-            cloud.name = f"Cloud_{i}"
-            cloud.data.materials.append(material)
+        # Reuse the cached .blend when the test geometry is unchanged
+        if self.scene_cache.load(self.spec):
+            self.compiler = SceneCompiler(self.spec, tier=self.tier)
+            self.compiler.compile(incremental=True)
+        else:
+            reset_scene()
             
-    def setup_lighting(self):
-        """Setup comprehensive lighting"""
-        bpy.ops.object.light_add(type='SUN', location=(5, 5, 10))
-        sun = bpy.context.active_object
-        sun.data.energy = 8.0
+            # Characters, waterfall, pagoda, environment and lighting from the spec
+            self.compiler.compile()
+            self.scene_cache.save(self.spec)
+        print("✅ Comprehensive test scene created.")
+        return self.compiler
         
-        bpy.ops.object.light_add(type='AREA', location=(0, 0, 8))
-        area = bpy.context.active_object
-        area.data.energy = 200.0
-        area.data.size = 15.0
+    def framing_shot(self, view):
+        """Camera spec, output path and animation frame for one framing view"""
+        name = view['name']
+        frame = self.spec['views'].index(view) + 1
+        return view_camera(self.spec, view, name=f"Camera_{name}"), frame_output(self.frame_pattern, frame), frame
         
-    def test_camera_framing(self, name, location, rotation, lens=35, focus_distance=50):
+    def test_camera_framing(self, view):
         """Test a specific camera framing"""
-        print(f"📷 Testing camera framing: {name}")
-        
-        # Create camera
-        bpy.ops.object.camera_add(location=location, rotation=rotation)
-        camera = bpy.context.active_object
-        camera.name = f"Camera_{name}"
-        camera.data.lens = lens
-        camera.data.clip_start = 0.1
-        camera.data.clip_end = 1000.0
-        
-        # Setup depth of field
-        camera.data.dof.use_dof = True
-        camera.data.dof.focus_distance = focus_distance
-        camera.data.dof.aperture_fstop = 5.6
-        
-        # Set as active camera
-        bpy.context.scene.camera = camera
-        
-        # Setup render settings
-        bpy.context.scene.render.engine = 'BLENDER_EEVEE'
-        bpy.context.scene.render.resolution_x = 1920
-        bpy.context.scene.render.resolution_y = 1080
-        bpy.context.scene.render.image_settings.file_format = 'PNG'
-        
-        # Render
-        output_path = os.path.join(self.output_dir, f"framing_test_{name}.png")
-        bpy.context.scene.render.filepath = output_path
-        bpy.ops.render.render(write_still=True)
-        print(f"✅ Rendered: {output_path}")
-        
-        # Remove camera for next test
-        bpy.data.objects.remove(camera, do_unlink=True)
+        print(f"📷 Testing camera framing: {view['name']}")
+        return render_camera_animation(self.compiler, [self.framing_shot(view)], self.frame_pattern)
         
     def run_comprehensive_framing_tests(self):
         """Run comprehensive camera framing tests"""
         print("🚀 Starting comprehensive camera framing tests...")
         
-        # Setup the scene
-        self.setup_test_scene()
-        
-        # Define comprehensive camera positions for perfect framing
-        framing_tests = [
-            # Perfect framing positions
-            ("perfect_center", (0, -55, 40), (math.radians(28), 0, 0), 32, 55),
-            ("perfect_left", (-10, -50, 35), (math.radians(30), math.radians(5), 0), 35, 50),
-            ("perfect_right", (10, -50, 35), (math.radians(30), math.radians(-5), 0), 35, 50),
-            
-            # Character-focused positions
-            ("character_close", (0, -40, 25), (math.radians(35), 0, 0), 40, 40),
-            ("character_wide", (0, -60, 45), (math.radians(25), 0, 0), 28, 60),
-            
-            # Environment-focused positions
-            ("environment_wide", (0, -70, 50), (math.radians(22), 0, 0), 24, 70),
-            ("environment_high", (0, -50, 60), (math.radians(15), 0, 0), 35, 50),
-            
-            # Balanced positions
-            ("balanced_1", (0, -45, 30), (math.radians(32), 0, 0), 36, 45),
-            ("balanced_2", (0, -65, 40), (math.radians(26), 0, 0), 30, 65),
-            ("balanced_3", (0, -55, 35), (math.radians(30), 0, 0), 33, 55),
-            
-            # Dynamic angles
-            ("dynamic_left", (-15, -45, 30), (math.radians(30), math.radians(10), 0), 35, 45),
-            ("dynamic_right", (15, -45, 30), (math.radians(30), math.radians(-10), 0), 35, 45),
-            
-            # Cinematic positions
-            ("cinematic_low", (0, -35, 20), (math.radians(40), 0, 0), 45, 35),
-            ("cinematic_high", (0, -75, 55), (math.radians(20), 0, 0), 25, 75),
-        ]
-        
-        for name, location, rotation, lens, focus in framing_tests:
-            self.test_camera_framing(name, location, rotation, lens, focus)
+        # All positions as one animation render; cached views skip it, and the scene is only built for misses
+        shots = [self.framing_shot(view) for view in self.views]
+        # Views of other shards steer LOD and settings too, so any sharding reuses the same cached frames
+        self.timings = render_cached_batch(self.spec, shots, self.tier, self.render_cache, self.setup_test_scene,
+                                           pattern=self.frame_pattern, context=context_cameras(self.spec, self.views))
+        write_manifest(self.output_dir, self.spec, self.views, shots, self.timings, self.tier, name=self.manifest_name)
             
         print("🎉 All framing tests completed!")
         print(f"📁 Check results in: {self.output_dir}")
@@ -261,18 +106,40 @@ class CameraFramingAnalyzer:
         print("📊 Framing Analysis Criteria:")
         for criterion, description in analysis_criteria.items():
             print(f"   • {criterion}: {description}")
-            
+        
+        # Visibility, size, centering, margins and occlusion are scored from the camera, no renders needed.
+        # A fully cached sweep never built the scene, and scoring needs its geometry.
+        subject_names = [name for _, names in framing_subjects(self.spec).values() for name in names]
+        if not any(name in bpy.data.objects for name in subject_names):
+            self.setup_test_scene()
+        results = score_views(self.spec, self.spec['views'])
+        print("\n📐 Analytic framing scores (0-10):")
+        print_scores(results)
+        # Views with a subject hidden behind trees or rocks are rejected before anyone renders them
+        candidates = [result for result in results if not result[1]['occluded']] or results
+        if candidates:
+            best_name, best_result = candidates[0]
+            self.best_framing = best_name
+            self.best_score = best_result['score']
+            print(f"\n🏆 Best analytic framing: {best_name} ({self.best_score:.2f}/10)")
+        
         print("\n🎯 Next steps:")
-        print("   1. Review all framing test renders")
-        print("   2. Identify the best framing position")
+        print("   1. Review the top-scoring framing test renders for lighting and technical quality")
+        print("   2. Confirm the best framing position")
         print("   3. Apply the best camera settings to main script")
         print("   4. Run final render with perfect framing")
 
 def main():
     """Main function"""
     analyzer = CameraFramingAnalyzer()
+    if '--optimize' in script_args():
+        # Search framings continuously instead of rendering the preset list; renders only the top few
+        optimize_views(analyzer.spec, analyzer.tier)
+        return
     analyzer.run_comprehensive_framing_tests()
-    analyzer.analyze_framing_results()
+    # Shards only render; the coordinator merges their manifests
+    if not script_option('--views'):
+        analyzer.analyze_framing_results()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Camera Optimizer
+Searches camera location, rotation and lens against the analytic framing score and renders only the best few
+
+    blender --background --python camera_optimizer.py -- framing_test --top-k 3 [--tier draft] [--grid 3] [--no-render]
+"""
+
+import math
+import os
+import sys
+import time
+
+from mathutils import Vector
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from camera_batch import render_cached_batch
+from framing_score import FramingScorer, print_scores
+from occlusion import OCCLUSION_GRID
+from quality_tiers import DEFAULT_TIER, tier_arg
+from render_preset import RenderPreset, script_args, script_option
+from scene_spec import SCRIPT_DIR, load_spec, save_json, view_camera
+from sweep_manifest import frame_output, write_manifest
+
+OUTPUT_DIR = os.path.join(SCRIPT_DIR, "references_and_renders", "optimized_views")
+
+# Seed grid around the characters: azimuth from the front (-Y), elevation, distance and lens
+SEED_AZIMUTHS = (-45.0, -22.5, 0.0, 22.5, 45.0)
+SEED_ELEVATIONS = (10.0, 25.0, 40.0)
+SEED_DISTANCES = (35.0, 55.0, 80.0)
+SEED_LENSES = (24.0, 35.0, 50.0)
+
+# Parameters: location x, y, z, pitch (rotation X), heading (rotation Z), lens; roll stays at 0
+INITIAL_STEPS = (4.0, 4.0, 4.0, 4.0, 4.0, 5.0)
+PITCH_RANGE = (0.0, 150.0)
+LENS_RANGE = (16.0, 100.0)
+MIN_HEIGHT = 0.5
+
+# Nelder-Mead runs from this many of the best distinct seeds
+STARTS = 4
+ITERATIONS = 120
+TOLERANCE = 1e-3
+
+# Score points lost per occluded subject, so the search steers around trees and rocks
+OCCLUSION_PENALTY = 1.0
+
+# Candidates closer than this in every parameter (units, degrees, mm) are the same framing
+MIN_SEPARATION = 3.0
+
+TOP_K = 3
+
+
+def look_at_rotation(location, target):
+    """Pitch and heading in degrees that point a camera (looking down its -Z) from location at target"""
+    dx, dy, dz = (target[i] - location[i] for i in range(3))
+    return math.degrees(math.atan2(math.hypot(dx, dy), -dz)), math.degrees(math.atan2(-dx, dy))
+
+
+def nelder_mead(f, x0, steps, iterations=ITERATIONS, tolerance=TOLERANCE):
+    """Minimise f from x0; returns the best point, its value and the number of evaluations"""
+    simplex = [list(x0)] + [[x + (step if i == j else 0.0) for j, x in enumerate(x0)] for i, step in enumerate(steps)]
+    values = [f(point) for point in simplex]
+    evaluations = len(simplex)
+    for _ in range(iterations):
+        order = sorted(range(len(simplex)), key=values.__getitem__)
+        simplex, values = [simplex[i] for i in order], [values[i] for i in order]
+        if values[-1] - values[0] < tolerance:
+            break
+        centroid = [sum(point[i] for point in simplex[:-1]) / (len(simplex) - 1) for i in range(len(x0))]
+
+        def towards(coefficient):
+            return [c + coefficient * (w - c) for c, w in zip(centroid, simplex[-1])]
+
+        reflected = towards(-1.0)
+        reflected_value = f(reflected)
+        evaluations += 1
+        if reflected_value < values[0]:
+            expanded = towards(-2.0)
+            expanded_value = f(expanded)
+            evaluations += 1
+            simplex[-1], values[-1] = ((expanded, expanded_value) if expanded_value < reflected_value
+                                       else (reflected, reflected_value))
+        elif reflected_value < values[-2]:
+            simplex[-1], values[-1] = reflected, reflected_value
+        else:
+            # Outside contraction when the reflection beat the worst point, inside otherwise
+            contracted = towards(-0.5 if reflected_value < values[-1] else 0.5)
+            contracted_value = f(contracted)
+            evaluations += 1
+            if contracted_value < min(reflected_value, values[-1]):
+                simplex[-1], values[-1] = contracted, contracted_value
+            else:
+                simplex = [simplex[0]] + [[b + 0.5 * (x - b) for b, x in zip(simplex[0], point)]
+                                          for point in simplex[1:]]
+                values = [values[0]] + [f(point) for point in simplex[1:]]
+                evaluations += len(simplex) - 1
+    best = min(range(len(simplex)), key=values.__getitem__)
+    return simplex[best], values[best], evaluations
+
+
+def distinct(candidates, count):
+    """First count candidates that differ from every earlier pick by more than MIN_SEPARATION"""
+    picked = []
+    for candidate in candidates:
+        if all(max(abs(a - b) for a, b in zip(candidate, other)) > MIN_SEPARATION for other in picked):
+            picked.append(candidate)
+            if len(picked) == count:
+                break
+    return picked
+
+
+class CameraOptimizer:
+    def __init__(self, spec, occlusion_grid=OCCLUSION_GRID):
+        self.spec = spec
+        self.scorer = FramingScorer(spec, occlusion_grid=occlusion_grid)
+        self.target = self.scorer.target()
+        self.results = {}
+
+    # ----------------------------------------
+    # PARAMETERS
+    # ----------------------------------------
+    def clamp(self, params):
+        x, y, z, pitch, heading, lens = params
+        return (x, y, max(z, MIN_HEIGHT), min(max(pitch, PITCH_RANGE[0]), PITCH_RANGE[1]),
+                (heading + 180.0) % 360.0 - 180.0, min(max(lens, LENS_RANGE[0]), LENS_RANGE[1]))
+
+    def view(self, params, name):
+        """Sweep view for a parameter vector, focused on the characters"""
+        x, y, z, pitch, heading, lens = self.clamp(params)
+        focus_distance = (self.target - Vector((x, y, z))).length
+        return {'name': name, 'location': [round(x, 3), round(y, 3), round(z, 3)],
+                'rotation': [round(pitch, 2), 0.0, round(heading, 2)], 'lens': round(lens, 2),
+                'focus_distance': round(focus_distance, 2)}
+
+    def seeds(self):
+        """The spec's preset views plus a grid of views looking at the characters"""
+        seeds = [tuple(view['location']) + (view['rotation'][0], view['rotation'][2], view.get('lens', 50.0))
+                 for view in self.spec.get('views', [])]
+        for azimuth in SEED_AZIMUTHS:
+            for elevation in SEED_ELEVATIONS:
+                for distance in SEED_DISTANCES:
+                    a, e = math.radians(azimuth), math.radians(elevation)
+                    offset = Vector((math.sin(a) * math.cos(e), -math.cos(a) * math.cos(e), math.sin(e))) * distance
+                    location = self.target + offset
+                    pitch, heading = look_at_rotation(location, self.target)
+                    seeds += [tuple(location) + (pitch, heading, lens) for lens in SEED_LENSES]
+        return seeds
+
+    # ----------------------------------------
+    # SEARCH
+    # ----------------------------------------
+    def evaluate(self, params):
+        key = tuple(round(value, 3) for value in self.clamp(params))
+        if key not in self.results:
+            self.results[key] = self.scorer.score_view(view_camera(self.spec, self.view(key, "candidate")))
+        return self.results[key]
+
+    def objective(self, params):
+        result = self.evaluate(params)
+        return -(result['score'] - OCCLUSION_PENALTY * len(result['occluded']))
+
+    def optimize(self, top_k=TOP_K, starts=STARTS):
+        """Best top_k distinct views as (view, score result) pairs"""
+        seeds = sorted(self.seeds(), key=self.objective)
+        print(f"🌱 [Optimizer] {len(seeds)} seeds scored, refining the best {starts}...")
+        refined = []
+        for seed in distinct(seeds, starts):
+            best, value, evaluations = nelder_mead(self.objective, seed, INITIAL_STEPS)
+            print(f"   {-self.objective(seed):5.2f} -> {-value:5.2f} in {evaluations} evaluations")
+            refined.append(best)
+        candidates = distinct(sorted(refined + seeds, key=self.objective), top_k)
+        return [(self.view(params, f"optimized_{i}"), self.evaluate(params)) for i, params in enumerate(candidates, 1)]
+
+    def close(self):
+        self.scorer.close()
+
+
+def write_views(output_dir, spec, views):
+    """Optimized views in spec 'views' format, ready to paste into the spec"""
+    path = os.path.join(output_dir, f"{spec['name']}_views.json")
+    save_json(path, views)
+    return path
+
+
+def optimize_views(spec, tier=DEFAULT_TIER, top_k=TOP_K, occlusion_grid=OCCLUSION_GRID, render=True):
+    """Search the spec's scene for its best top_k views, save them and render them at the sweep tier"""
+    preset = RenderPreset(spec, tier=tier)
+    print(f"🎯 Camera optimizer: {preset.title}")
+    print("=" * 50)
+    preset.prepare_scene()
+
+    start = time.perf_counter()
+    optimizer = CameraOptimizer(spec, occlusion_grid=occlusion_grid)
+    try:
+        presets = [(view['name'], optimizer.scorer.score_view(view_camera(spec, view)))
+                   for view in spec.get('views', [])]
+        best = optimizer.optimize(top_k)
+    finally:
+        optimizer.close()
+    search_time = time.perf_counter() - start
+    print_scores([(view['name'], result) for view, result in best])
+
+    if presets:
+        best_preset = max(presets, key=lambda item: item[1]['score'])
+        print(f"\n📊 Best preset {best_preset[0]}: {best_preset[1]['score']:.2f} "
+              f"(exhaustive sweep: {len(presets)} renders)")
+    print(f"📊 Best optimized: {best[0][1]['score']:.2f} ({len(optimizer.results)} evaluations in {search_time:.1f}s, "
+          f"{len(best)} renders)")
+
+    output_dir = os.path.join(OUTPUT_DIR, spec['name'])
+    os.makedirs(output_dir, exist_ok=True)
+    views = [view for view, _ in best]
+    print(f"💾 Views saved to {write_views(output_dir, spec, views)}")
+
+    if render:
+        # Confirmation renders: only the top candidates, as one animation at the sweep tier
+        pattern = os.path.join(output_dir, f"{spec['name']}_####.png")
+        shots = [(view_camera(spec, view, name=f"Camera_{view['name']}"), frame_output(pattern, i), i)
+                 for i, view in enumerate(views, 1)]
+        timings = render_cached_batch(spec, shots, tier, preset.render_cache, lambda: preset.compiler,
+                                      pattern=pattern)
+        write_manifest(output_dir, spec, views, shots, timings, tier)
+    print("=" * 50)
+    return best
+
+
+def main():
+    args = script_args()
+    spec = load_spec(args[0] if args and not args[0].startswith('--') else "framing_test")
+    optimize_views(spec, tier_arg(args), int(script_option('--top-k', TOP_K)),
+                   int(script_option('--grid', OCCLUSION_GRID)), render='--no-render' not in args)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,20 @@ Camera Testing Script for Ultimate Cascade Render
 Tests multiple camera positions to find the perfect view for 100% visibility
 """
 
-import bpy
-import math
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_cache import SceneCache
+from scene_compiler import SceneCompiler
+from scene_reset import reset_scene
+from camera_batch import render_camera_animation, render_cached_batch
+from camera_optimizer import optimize_views
+from quality_tiers import tier_arg
+from render_cache import RenderCache
+from render_preset import script_args, script_option
+from scene_spec import context_cameras, load_spec, view_camera
+from sweep_manifest import MANIFEST_NAME, frame_output, write_manifest
 
 class CameraTester:
     def __init__(self):
@@ -15,178 +26,67 @@ class CameraTester:
             "references_and_renders", "camera_tests"
         )
         os.makedirs(self.output_dir, exist_ok=True)
+        # Test scene and camera positions live in scene_specs/camera_test.json
+        self.spec = load_spec("camera_test")
+        # Sweeps render at the draft tier unless '-- --tier NAME' asks for another
+        self.tier = tier_arg(script_args())
+        self.compiler = SceneCompiler(self.spec, tier=self.tier)
+        self.scene_cache = SceneCache()
+        self.render_cache = RenderCache()
+        # '-- --views a,b' renders one shard of a sharded sweep; frames keep their full-list numbers
+        selected = script_option('--views')
+        self.views = [view for view in self.spec['views'] if not selected or view['name'] in selected.split(',')]
+        self.manifest_name = script_option('--manifest', MANIFEST_NAME)
+        # One animation frame per view, in spec order; manifest.json maps frames back to view names
+        self.frame_pattern = os.path.join(self.output_dir, "camera_test_####.png")
+        self.timings = []
         
     def setup_scene(self):
         """Setup the basic scene with all elements"""
         print("🎬 Setting up test scene...")
         
-        # Clear scene
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
-        
-        # Create materials
-        materials = {
-            'red': self.create_material("Red", (1.0, 0.0, 0.0)),
-            'pink': self.create_material("Pink", (1.0, 0.2, 0.8)),
-            'green': self.create_material("Green", (0.0, 1.0, 0.0)),
-            'water': self.create_material("Water", (0.2, 0.6, 0.9)),
-            'rock': self.create_material("Rock", (0.5, 0.5, 0.5)),
-            'vegetation': self.create_material("Vegetation", (0.1, 0.6, 0.1)),
-        }
-        
-        # Create characters (A, B, C)
-        self.create_test_character('A', (-20, -25, 12), materials['red'], scale=8.0)
-        self.create_test_character('B', (0, -25, 12), materials['pink'], scale=8.0)
-        self.create_test_character('C', (20, -25, 12), materials['green'], scale=8.0)
-        
-        # Create waterfall
-        self.create_waterfall((-10, -15, 10), materials['water'])
-        
-        # Create some environment elements
-        self.create_ground(materials['rock'])
-        self.create_trees(materials['vegetation'])
-        
-        # Setup lighting
-        self.setup_lighting()
-        
+        # Reuse the cached .blend when the test geometry is unchanged
+        if self.scene_cache.load(self.spec):
+            self.compiler = SceneCompiler(self.spec, tier=self.tier)
+            self.compiler.compile(incremental=True)
+        else:
+            reset_scene()
+            
+            # Characters, waterfall, ground, trees and lighting from the spec
+            self.compiler.compile()
+            self.scene_cache.save(self.spec)
         print("✅ Test scene created.")
+        return self.compiler
     
-    def create_material(self, name, color):
-        mat = bpy.data.materials.new(name)
-        mat.use_nodes = False
-        mat.diffuse_color = (*color[:3], 1.0)
-        return mat
-    
-    def create_test_character(self, letter, pos, material, scale=1.0):
-        """Create a simple test character"""
-        # Main body
-        bpy.ops.mesh.primitive_cube_add(location=pos, scale=(scale, scale, scale))
-        obj = bpy.context.active_object
-        obj.name = f"{letter}_Body"
-        obj.data.materials.append(material)
-        
-        # Eyes
-        bpy.ops.mesh.primitive_uv_sphere_add(location=(pos[0] - 0.5, pos[1] + 0.5, pos[2] + 0.5), scale=(0.3, 0.3, 0.3))
-        eye = bpy.context.active_object
-        eye.name = f"{letter}_Eye1"
-        eye.data.materials.append(self.create_material("White", (1.0, 1.0, 1.0)))
-        
-        bpy.ops.mesh.primitive_uv_sphere_add(location=(pos[0] + 0.5, pos[1] + 0.5, pos[2] + 0.5), scale=(0.3, 0.3, 0.3))
-        eye = bpy.context.active_object
-        eye.name = f"{letter}_Eye2"
-        eye.data.materials.append(self.create_material("White", (1.0, 1.0, 1.0)))
-    
-    def create_waterfall(self, pos, material):
-        """Create a simple waterfall"""
-        bpy.ops.mesh.primitive_plane_add(location=pos, scale=(15, 2, 15))
-        waterfall = bpy.context.active_object
-        waterfall.name = "Waterfall"
-        waterfall.rotation_euler = (math.radians(90), 0, 0)
-        waterfall.data.materials.append(material)
-    
-    def create_ground(self, material):
-        """Create ground plane"""
-        bpy.ops.mesh.primitive_plane_add(location=(0, 0, -2), scale=(50, 50, 1))
-        ground = bpy.context.active_object
-        ground.name = "Ground"
-        ground.data.materials.append(material)
-    
-    def create_trees(self, material):
-        """Create some test trees"""
-        for i in range(5):
-            x = (i - 2) * 10
-            bpy.ops.mesh.primitive_cylinder_add(location=(x, -30, 0), scale=(1, 1, 5))
-            tree = bpy.context.active_object
-            tree.name = f"Tree_{i}"
-            tree.data.materials.append(material)
-    
-    def setup_lighting(self):
-        """Setup basic lighting"""
-        bpy.ops.object.light_add(type='SUN', location=(5, 5, 10))
-        sun = bpy.context.active_object
-        sun.data.energy = 5.0
-        
-        bpy.ops.object.light_add(type='AREA', location=(0, 0, 8))
-        area = bpy.context.active_object
-        area.data.energy = 100.0
-        area.data.size = 10.0
+    def camera_shot(self, view):
+        """Camera spec, output path and animation frame for one test view"""
+        name = view['name']
+        frame = self.spec['views'].index(view) + 1
+        return view_camera(self.spec, view, name=f"Camera_{name}"), frame_output(self.frame_pattern, frame), frame
     
-    def test_camera_position(self, name, location, rotation, lens=35, focus_distance=50):
+    def test_camera_position(self, view):
         """Test a specific camera position"""
-        print(f"📷 Testing camera position: {name}")
-        
-        # Create camera
-        bpy.ops.object.camera_add(location=location, rotation=rotation)
-        camera = bpy.context.active_object
-        camera.name = f"Camera_{name}"
-        camera.data.lens = lens
-        camera.data.clip_start = 0.1
-        camera.data.clip_end = 1000.0
-        
-        # Setup depth of field
-        camera.data.dof.use_dof = True
-        camera.data.dof.focus_distance = focus_distance
-        camera.data.dof.aperture_fstop = 5.6
-        
-        # Set as active camera
-        bpy.context.scene.camera = camera
-        
-        # Setup render settings
-        bpy.context.scene.render.engine = 'BLENDER_EEVEE'
-        bpy.context.scene.render.resolution_x = 1920
-        bpy.context.scene.render.resolution_y = 1080
-        bpy.context.scene.render.image_settings.file_format = 'PNG'
-        
-        # Render
-        output_path = os.path.join(self.output_dir, f"camera_test_{name}.png")
-        bpy.context.scene.render.filepath = output_path
-        bpy.ops.render.render(write_still=True)
-        
-        print(f"✅ Rendered: {output_path}")
-        
-        # Remove camera for next test
-        bpy.data.objects.remove(camera, do_unlink=True)
+        print(f"📷 Testing camera position: {view['name']}")
+        return render_camera_animation(self.compiler, [self.camera_shot(view)], self.frame_pattern)
     
     def run_all_tests(self):
         """Run all camera position tests"""
         print("🚀 Starting camera position tests...")
         
-        # Setup the scene
-        self.setup_scene()
-        
-        # Test different camera positions
-        camera_tests = [
-            # Test 1: Far back, high angle
-            ("far_high", (0, -60, 45), (math.radians(25), 0, 0), 35, 50),
-            
-            # Test 2: Medium distance, medium angle
-            ("medium_medium", (0, -40, 30), (math.radians(35), 0, 0), 40, 40),
-            
-            # Test 3: Closer, lower angle
-            ("close_low", (0, -30, 20), (math.radians(45), 0, 0), 50, 30),
-            
-            # Test 4: Very far, very high
-            ("very_far_high", (0, -80, 60), (math.radians(20), 0, 0), 28, 70),
-            
-            # Test 5: Side angle view
-            ("side_view", (20, -40, 30), (math.radians(30), math.radians(15), 0), 35, 45),
-            
-            # Test 6: Wide angle view
-            ("wide_angle", (0, -50, 35), (math.radians(30), 0, 0), 24, 50),
-            
-            # Test 7: Telephoto view
-            ("telephoto", (0, -70, 50), (math.radians(25), 0, 0), 70, 60),
-            
-            # Test 8: Perfect framing (our best guess)
-            ("perfect_framing", (0, -55, 40), (math.radians(28), 0, 0), 32, 55),
-        ]
-        
-        for name, location, rotation, lens, focus in camera_tests:
-            self.test_camera_position(name, location, rotation, lens, focus)
+        # All positions as one animation render; cached views skip it, and the scene is only built for misses
+        shots = [self.camera_shot(view) for view in self.views]
+        # Views of other shards steer LOD and settings too, so any sharding reuses the same cached frames
+        self.timings = render_cached_batch(self.spec, shots, self.tier, self.render_cache, self.setup_scene,
+                                           pattern=self.frame_pattern, context=context_cameras(self.spec, self.views))
+        write_manifest(self.output_dir, self.spec, self.views, shots, self.timings, self.tier, name=self.manifest_name)
         
         print("🎉 All camera tests completed!")
         print(f"📁 Check results in: {self.output_dir}")
 
 if __name__ == "__main__":
     tester = CameraTester()
-    tester.run_all_tests()
+    if '--optimize' in script_args():
+        # Search positions continuously instead of rendering the preset list; renders only the top few
+        optimize_views(tester.spec, tester.tier)
+    else:
+        tester.run_all_tests()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Cycles Sampling
+Adaptive sampling, wall-clock limits and denoiser fallback for CPU-only render nodes
+"""
+
+import re
+
+import bpy
+
+# Progress lines look like "... | Sample 37/512" (older builds: "Path Tracing Sample 37/512")
+SAMPLE_PATTERN = re.compile(r"Sample (\d+)/(\d+)")
+
+
+def optix_available():
+    """True when Cycles can see at least one OptiX device"""
+    try:
+        prefs = bpy.context.preferences.addons['cycles'].preferences
+        prefs.refresh_devices()
+        return any(device.type == 'OPTIX' for device in prefs.devices)
+    except Exception:
+        return False
+
+
+def select_denoiser(scene):
+    """Swap OptiX for OpenImageDenoise when no OptiX device exists, instead of failing or silently skipping"""
+    cycles = scene.cycles
+    if not cycles.use_denoising or cycles.denoiser != 'OPTIX' or optix_available():
+        return cycles.denoiser
+    cycles.denoiser = 'OPENIMAGEDENOISE'
+    print("⚠️ [Cycles] OptiX unavailable, denoising with OpenImageDenoise on the CPU")
+    return cycles.denoiser
+
+
+def configure_sampling(scene, time_limit=None):
+    """Apply a command-line time limit and keep the adaptive floor under the sample ceiling"""
+    cycles = scene.cycles
+    if time_limit is not None:
+        try:
+            cycles.time_limit = time_limit
+        except AttributeError:
+            print("⚠️ [Cycles] time_limit needs Blender 3.0+, rendering without a time limit")
+    if cycles.use_adaptive_sampling and cycles.adaptive_min_samples > cycles.samples:
+        # Quality tiers lower the ceiling; a higher floor would quietly undo them
+        cycles.adaptive_min_samples = cycles.samples
+    limit = getattr(cycles, 'time_limit', 0)
+    mode = (f"adaptive {cycles.adaptive_min_samples}-{cycles.samples} samples, noise threshold "
+            f"{cycles.adaptive_threshold}" if cycles.use_adaptive_sampling else f"{cycles.samples} samples")
+    print(f"⚙️ [Cycles] {mode}, denoiser {select_denoiser(scene) if cycles.use_denoising else 'off'}"
+          + (f", time limit {limit:.0f}s" if limit else ""))
+
+
+# Follows render_stats during a render to report the samples actually taken
+class SampleMonitor:
+    def __init__(self):
+        self.samples = None
+        self.max_samples = None
+
+    def on_stats(self, stats):
+        match = SAMPLE_PATTERN.search(stats)
+        if match:
+            self.samples, self.max_samples = int(match.group(1)), int(match.group(2))
+
+    def __enter__(self):
+        bpy.app.handlers.render_stats.append(self.on_stats)
+        return self
+
+    def __exit__(self, *exc):
+        bpy.app.handlers.render_stats.remove(self.on_stats)
+        return False
+
+    def report(self, elapsed):
+        samples = f"{self.samples}/{self.max_samples} samples" if self.samples is not None else "samples unknown"
+        print(f"📊 [Cycles] {samples} in {elapsed:.1f}s")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+EEVEE Quality
+Shadow map size, soft shadows, GTAO and bloom fitted to the output resolution and scene extent
+"""
+
+import bpy
+from mathutils import Vector
+
+SHADOW_SIZES = (512, 1024, 2048, 4096)
+
+# Below this long edge (draft and thumbnail) GTAO and bloom cost more than they show
+FEATURE_EDGE = 1280
+
+# Soft shadows are resolved across TAA samples; fewer samples only add noise
+SOFT_SHADOW_SAMPLES = 16
+
+# The authored 0.2 GTAO distance suits the ~80 unit cascade scene; smaller scenes scale it down
+GTAO_EXTENT_FACTOR = 0.0025
+GTAO_DISTANCE_RANGE = (0.05, 2.0)
+
+# Settings this module owns; the report compares them against the spec's authored values
+FITTED_KEYS = ('shadow_cascade_size', 'shadow_cube_size', 'use_soft_shadows', 'use_gtao', 'gtao_distance',
+               'use_bloom')
+
+
+def output_long_edge(scene):
+    render = scene.render
+    return max(render.resolution_x, render.resolution_y) * render.resolution_percentage / 100
+
+
+def shadow_size(pixels):
+    """Smallest shadow map enum with at least one texel per output pixel"""
+    return str(next((size for size in SHADOW_SIZES if size >= pixels), SHADOW_SIZES[-1]))
+
+
+def scene_bounds(scene):
+    """Centre and radius of the rendered mesh objects' world bounding boxes; None for an empty scene"""
+    corners = [obj.matrix_world @ Vector(corner) for obj in scene.objects
+               if obj.type == 'MESH' and not obj.hide_render for corner in obj.bound_box]
+    if not corners:
+        return None
+    low = Vector([min(c[i] for c in corners) for i in range(3)])
+    high = Vector([max(c[i] for c in corners) for i in range(3)])
+    return (low + high) / 2, (high - low).length / 2
+
+
+def authored_long_edge(render_spec):
+    """Output long edge the spec's render section was authored for"""
+    render = render_spec.get('render', {})
+    edge = max(render.get('resolution_x', 1920), render.get('resolution_y', 1080))
+    return edge * render.get('resolution_percentage', 100) / 100
+
+
+def authored_value(owner, key, authored):
+    """The spec's value for key, else Blender's default; the current value when there is no spec"""
+    if authored is None:
+        return getattr(owner, key)
+    if key in authored:
+        return authored[key]
+    return owner.bl_rna.properties[key].default
+
+
+def cheaper(fitted, ceiling):
+    """The fitted value, never costlier than the ceiling: effects stay off, sizes and distances never grow"""
+    if isinstance(fitted, bool):
+        return fitted and bool(ceiling)
+    if isinstance(fitted, str):
+        return str(min(int(fitted), int(ceiling)))
+    return min(fitted, ceiling)
+
+
+def fit_eevee_settings(scene=None, cameras=None, render_spec=None):
+    """Size EEVEE's shadow and screen-space effects to this render; only ever lowers them below the spec's values"""
+    scene = scene if scene is not None else bpy.context.scene
+    if 'EEVEE' not in scene.render.engine:
+        return None
+    cameras = [camera for camera in (cameras if cameras is not None else [scene.camera]) if camera is not None]
+    eevee = scene.eevee
+    edge = output_long_edge(scene)
+    bounds = scene_bounds(scene)
+    # Without a spec the scene's current values are the authored ones
+    authored = render_spec.get('eevee', {}) if render_spec is not None else None
+
+    # At the spec's own resolution the largest size clamps to the authored maps; smaller tiers get one texel per pixel
+    full = render_spec is not None and edge >= authored_long_edge(render_spec)
+    settings = {
+        'shadow_cascade_size': str(SHADOW_SIZES[-1]) if full else shadow_size(edge),
+        # Each cube face spans 90 degrees, so half the output edge keeps texels near pixel size
+        'shadow_cube_size': str(SHADOW_SIZES[-1]) if full else shadow_size(edge / 2),
+        'use_soft_shadows': eevee.taa_render_samples >= SOFT_SHADOW_SAMPLES,
+    }
+    if edge < FEATURE_EDGE:
+        settings.update(use_gtao=False, use_bloom=False)
+    if bounds is not None:
+        low, high = GTAO_DISTANCE_RANGE
+        settings['gtao_distance'] = min(max(bounds[1] * 2 * GTAO_EXTENT_FACTOR, low), high)
+
+    for key, value in settings.items():
+        # EEVEE Next (4.2+) dropped several legacy properties
+        if hasattr(eevee, key):
+            settings[key] = cheaper(value, authored_value(eevee, key, authored))
+            setattr(eevee, key, settings[key])
+
+    if bounds is not None and cameras:
+        # Sun cascades only need to reach the far side of the scene; shorter cascades mean sharper texels
+        center, radius = bounds
+        reach = max(min((camera.matrix_world.translation - center).length + radius, camera.data.clip_end)
+                    for camera in cameras)
+        for light in bpy.data.lights:
+            if light.type == 'SUN' and hasattr(light, 'shadow_cascade_max_distance'):
+                # Specs author no cascade distance, so with a spec Blender's default is the ceiling
+                ceiling = authored_value(light, 'shadow_cascade_max_distance', None if render_spec is None else {})
+                light.shadow_cascade_max_distance = min(reach, ceiling)
+
+    print(f"🌓 [EEVEE] {edge:.0f}px: cascade {settings['shadow_cascade_size']}, cube {settings['shadow_cube_size']}, "
+          f"soft shadows {'on' if settings['use_soft_shadows'] else 'off'}"
+          + (", GTAO and bloom off" if edge < FEATURE_EDGE else ""))
+    return settings
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+EEVEE Quality Report
+Times every quality tier with the spec's authored shadow/AO/bloom settings and with the fitted ones
+
+    blender --background --python eevee_quality_report.py -- ultimate_cascade
+"""
+
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from eevee_quality import FITTED_KEYS
+from quality_tiers import TIERS
+from render_preset import RenderPreset, script_args
+from scene_compiler import apply_settings
+from scene_spec import load_spec
+
+
+def timed_render():
+    start = time.perf_counter()
+    bpy.ops.render.render()
+    return time.perf_counter() - start
+
+
+def report_savings(spec_name):
+    preset = RenderPreset(load_spec(spec_name))
+    print(f"📊 EEVEE settings report: {preset.title}")
+    print("=" * 50)
+    preset.prepare_scene()
+    authored = {key: value for key, value in preset.spec.get('render', {}).get('eevee', {}).items()
+                if key in FITTED_KEYS}
+
+    # Shader compilation lands in the first render; keep it out of the comparison
+    preset.compiler.tier = 'thumbnail'
+    preset.compiler.setup_render_settings()
+    timed_render()
+
+    rows = []
+    for tier in TIERS:
+        preset.compiler.tier = tier
+        preset.compiler.setup_render_settings()
+        fitted = timed_render()
+        apply_settings(bpy.context.scene, {'eevee': authored}, "EEVEE")
+        rows.append((tier, timed_render(), fitted))
+
+    print(f"\n   {'tier':<10} {'authored':>9} {'fitted':>9} {'saved':>9}")
+    for tier, authored_time, fitted_time in rows:
+        saved = authored_time - fitted_time
+        print(f"   {tier:<10} {authored_time:8.1f}s {fitted_time:8.1f}s {saved:8.1f}s "
+              f"({saved / authored_time:.0%})" if authored_time else f"   {tier:<10} -")
+    print("=" * 50)
+    return rows
+
+
+if __name__ == "__main__":
+    args = script_args()
+    report_savings(args[0] if args else "ultimate_cascade")
@@ -5,9 +5,10 @@ Helps locate Blender and provides the correct command to run camera tests
 """
 
 import os
-import subprocess
 import sys
 
+from sweep_shards import default_shard_count, run_sharded_sweep, threads_per_shard
+
 def find_blender():
     """Find Blender installation"""
     possible_paths = [
@@ -56,10 +57,11 @@ def run_camera_tests(blender_path):
     print(f"📷 Blender: {blender_path}")
     print(f"📝 Script: {camera_script}")
     
-    # Build the command
-    cmd = [blender_path, "--background", "--python", camera_script]
+    # Build the command; the cameras are split across parallel Blender processes
+    shards = default_shard_count()
+    cmd = ["python", "sweep_shards.py", "camera_test", "--shards", str(shards)]
     
-    print(f"\n💻 Command to run:")
+    print(f"\n💻 Command to run ({shards} Blender processes, {threads_per_shard(shards)} threads each):")
     print(f"   {' '.join(cmd)}")
     
     # Ask user if they want to run it
@@ -68,21 +70,15 @@ def run_camera_tests(blender_path):
     if response == 'y':
         try:
             print("⏳ Running camera tests...")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode == 0:
+            if run_sharded_sweep(blender_path, "camera_test", shards):
                 print("✅ Camera tests completed successfully!")
                 print("📁 Check the results in: references_and_renders/camera_tests/")
                 return True
             else:
                 print("❌ Camera tests failed!")
-                print("Error output:")
-                print(result.stderr)
+                print("Error output: references_and_renders/camera_tests/sweep.log")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            print("❌ Camera tests timed out")
-            return False
         except Exception as e:
             print(f"❌ Error running camera tests: {e}")
             return False
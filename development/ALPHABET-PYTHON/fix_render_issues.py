@@ -11,6 +11,10 @@ Addresses the main problems identified in the analysis:
 import bpy
 import math
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from eevee_quality import fit_eevee_settings
 
 def fix_render_issues():
     """Fix the main issues in the current render"""
@@ -18,7 +22,8 @@ def fix_render_issues():
     
     # 1. Fix character mouths - make them MUCH larger and more visible
     print("👄 Fixing character mouths...")
-    for letter in ['A', 'B', 'C']:
+    # 'Rig' reaches the shared character rig template that every letter instances
+    for letter in ['A', 'B', 'C', 'Rig']:
         mouth_name = f"{letter}_Mouth"
         if mouth_name in bpy.data.objects:
             mouth = bpy.data.objects[mouth_name]
@@ -75,9 +80,11 @@ def fix_render_issues():
     scene.eevee.taa_render_samples = 128  # More samples for better quality
     scene.eevee.use_taa_reprojection = True
     scene.eevee.use_gtao = True
-    scene.eevee.gtao_distance = 0.2
     scene.eevee.gtao_factor = 1.0
     
+    # Shadow maps, soft shadows and GTAO distance sized to this render's resolution and scene
+    fit_eevee_settings(scene)
+    
     print("✅ Render issues fixed!")
 
 def main():
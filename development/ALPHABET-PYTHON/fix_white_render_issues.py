@@ -7,6 +7,10 @@ Comprehensive fix for the washed-out render appearance
 import bpy
 import math
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from eevee_quality import fit_eevee_settings
 
 def fix_white_render_issues():
     """Fix all issues causing the white/washed-out render"""
@@ -60,7 +64,8 @@ def fix_white_render_issues():
     
     # 5. FIX CHARACTER VISIBILITY - Make them much larger and more prominent
     print("🎭 Fixing character visibility...")
-    for letter in ['A', 'B', 'C']:
+    # 'Rig' reaches the shared character rig template that every letter instances
+    for letter in ['A', 'B', 'C', 'Rig']:
         # Make body much larger
         body_name = f"{letter}_Body"
         if body_name in bpy.data.objects:
@@ -106,17 +111,17 @@ def fix_white_render_issues():
     scene.eevee.taa_render_samples = 128  # Good quality
     scene.eevee.use_taa_reprojection = True
     scene.eevee.use_gtao = True
-    scene.eevee.gtao_distance = 0.2
     scene.eevee.gtao_factor = 1.0
     
     # Enhanced shadows
     scene.eevee.use_shadows = True
-    scene.eevee.shadow_cascade_size = '2048'
-    scene.eevee.shadow_cube_size = '2048'
     
     # Reduce bloom to prevent washout
     scene.eevee.use_bloom = False
     
+    # Shadow maps, soft shadows and GTAO distance sized to this render's resolution and scene
+    fit_eevee_settings(scene)
+    
     # 7. FIX BACKGROUND - Make it darker for better contrast
     print("🌍 Fixing background...")
     world = bpy.context.scene.world
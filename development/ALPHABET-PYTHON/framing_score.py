@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Framing Score
+Scores camera framing analytically by projecting subject bounding boxes through the camera, without rendering
+
+    blender --background --python framing_score.py -- framing_test [--grid 3]
+"""
+
+import math
+import os
+import sys
+import time
+
+import bpy
+from bpy_extras.object_utils import world_to_camera_view
+from mathutils import Euler, Matrix, Vector
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from occlusion import OCCLUSION_GRID, OcclusionEstimator
+from render_preset import RenderPreset, script_args, script_option
+from scene_compiler import apply_settings, radians
+from scene_spec import load_spec, view_camera
+
+# Safe-area margin as a fraction of the frame; subjects crossing it count as margin violations
+MARGIN = 0.05
+
+# Characters together should fill this share of the frame; the waterfall is prominent above its share
+CHARACTER_SHARE = (0.05, 0.35)
+WATERFALL_SHARE = 0.08
+
+# Subjects in frame but less visible than this behind other objects reject the framing
+MIN_VISIBLE = 0.5
+
+# Criteria from CameraFramingAnalyzer.analyze_framing_results; missing subjects drop out of the total
+WEIGHTS = {
+    'character_visibility': 35,
+    'character_size': 10,
+    'character_centering': 10,
+    'waterfall_prominence': 20,
+    'pagoda_visibility': 10,
+    'margins': 15,
+}
+
+SCORE_CAMERA = "Camera_Score"
+
+
+def framing_subjects(spec):
+    """Object names per subject: one per character letter, plus the waterfall and pagoda groups"""
+    environment = spec.get('environment', {})
+    subjects = {}
+    for letter in spec.get('characters', {}).get('letters', []):
+        # The rig instance carries eyes, mouth and limbs; only meshes count towards framing
+        subjects[letter['letter']] = ('character', [f"{letter['letter']}_Body", f"{letter['letter']}_Rig"])
+    for part in environment.get('characters', []):
+        letter = part['name'].split('_')[0]
+        subjects.setdefault(letter, ('character', []))[1].append(part['name'])
+    for group in ('waterfall', 'pagoda'):
+        if environment.get(group):
+            subjects[group] = (group, [part['name'] for part in environment[group]])
+    return subjects
+
+
+def world_corners(obj):
+    return [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
+
+
+def clip(value):
+    return min(max(value, 0.0), 1.0)
+
+
+def share_fit(share, low, high):
+    """1 inside [low, high], falling linearly to 0 at an empty or a completely filled frame"""
+    if share < low:
+        return share / low
+    if share > high:
+        return max(0.0, 1 - (share - high) / (1 - high))
+    return 1.0
+
+
+class FramingScorer:
+    def __init__(self, spec, scene=None, occlusion_grid=OCCLUSION_GRID):
+        self.scene = scene if scene is not None else bpy.context.scene
+        self.camera = None
+        # World-space corners do not depend on the camera, so each camera only pays for the projection
+        self.subjects = {}
+        subjects = framing_subjects(spec)
+        for name, (role, object_names) in subjects.items():
+            objects = [bpy.data.objects.get(object_name) for object_name in object_names]
+            corners = [corner for obj in objects if obj is not None and obj.type == 'MESH'
+                       for corner in world_corners(obj)]
+            if corners:
+                self.subjects[name] = (role, corners)
+            else:
+                print(f"⚠️ Framing subject '{name}' has no objects in the scene")
+        # Bounding boxes cannot tell when trees or rocks stand in front of a subject
+        self.occlusion = None
+        if occlusion_grid:
+            self.occlusion = OcclusionEstimator({name: subjects[name][1] for name in self.subjects}, self.scene,
+                                                occlusion_grid)
+
+    # ----------------------------------------
+    # CAMERA
+    # ----------------------------------------
+    def place(self, camera_spec):
+        """Scratch camera for a camera spec; never linked to the scene, so nothing renders through it"""
+        if self.camera is None:
+            self.camera = bpy.data.objects.new(SCORE_CAMERA, bpy.data.cameras.new(SCORE_CAMERA))
+        settings = {k: v for k, v in camera_spec.items() if k not in ('name', 'location', 'rotation', 'dof')}
+        apply_settings(self.camera.data, settings, "Camera")
+        rotation = Euler(radians(camera_spec['rotation']), 'XYZ')
+        # Set the matrix directly; location/rotation only reach matrix_world after a depsgraph update
+        self.camera.matrix_world = Matrix.Translation(Vector(camera_spec['location'])) @ rotation.to_matrix().to_4x4()
+        return self.camera
+
+    def close(self):
+        if self.camera is not None:
+            data = self.camera.data
+            bpy.data.objects.remove(self.camera)
+            bpy.data.cameras.remove(data)
+            self.camera = None
+
+    # ----------------------------------------
+    # METRICS
+    # ----------------------------------------
+    def rect(self, camera, corners):
+        """Screen rectangle (normalised 0-1) of the corners in front of the camera, and that front fraction"""
+        clip_start, clip_end = camera.data.clip_start, camera.data.clip_end
+        points = [world_to_camera_view(self.scene, camera, corner) for corner in corners]
+        front = [point for point in points if clip_start < point.z < clip_end]
+        if not front:
+            return None, 0.0
+        xs, ys = [point.x for point in front], [point.y for point in front]
+        return (min(xs), min(ys), max(xs), max(ys)), len(front) / len(points)
+
+    def measure(self, rect, front):
+        """In-frame fraction, screen share, centre offset and margin violations of one screen rectangle"""
+        if rect is None:
+            return {'in_frame': 0.0, 'share': 0.0, 'offset': 1.0, 'margin_violations': 4}
+        x0, y0, x1, y1 = rect
+        area = max((x1 - x0) * (y1 - y0), 1e-9)
+        share = (clip(x1) - clip(x0)) * (clip(y1) - clip(y0))
+        center_x, center_y = (clip(x0) + clip(x1)) / 2, (clip(y0) + clip(y1)) / 2
+        edges = (x0 < MARGIN, y0 < MARGIN, x1 > 1 - MARGIN, y1 > 1 - MARGIN)
+        return {
+            'in_frame': share / area * front,
+            'share': share,
+            'offset': math.hypot(center_x - 0.5, center_y - 0.5) / math.hypot(0.5, 0.5),
+            'margin_violations': sum(edges),
+        }
+
+    def criteria(self, subjects, character_rect):
+        characters = [m for m in subjects.values() if m['role'] == 'character']
+        values = {}
+        if characters:
+            group = self.measure(*character_rect)
+            # All characters must be visible, so the least visible one counts
+            values['character_visibility'] = min(m['in_frame'] * m['visible'] for m in characters)
+            values['character_size'] = share_fit(group['share'], *CHARACTER_SHARE)
+            values['character_centering'] = 1 - group['offset']
+        for metrics in subjects.values():
+            if metrics['role'] == 'waterfall':
+                prominence = min(metrics['share'] / WATERFALL_SHARE, 1.0)
+                values['waterfall_prominence'] = metrics['in_frame'] * metrics['visible'] * prominence
+            elif metrics['role'] == 'pagoda':
+                values['pagoda_visibility'] = metrics['in_frame'] * metrics['visible']
+        if subjects:
+            violations = sum(m['margin_violations'] for m in subjects.values())
+            values['margins'] = 1 - violations / (4 * len(subjects))
+        return values
+
+    def score(self, camera):
+        """0-10 framing score with per-criterion values, per-subject metrics and the occluded subjects"""
+        start = time.perf_counter()
+        visible = self.occlusion.estimate(camera) if self.occlusion else {}
+        subjects = {}
+        character_corners = []
+        for name, (role, corners) in self.subjects.items():
+            subjects[name] = dict(self.measure(*self.rect(camera, corners)), role=role, visible=visible.get(name, 1.0))
+            if role == 'character':
+                character_corners += corners
+        values = self.criteria(subjects, self.rect(camera, character_corners))
+        total = sum(WEIGHTS[key] for key in values)
+        score = 10 * sum(WEIGHTS[key] * value for key, value in values.items()) / total if total else 0.0
+        occluded = [name for name, m in subjects.items() if m['in_frame'] > 0 and m['visible'] < MIN_VISIBLE]
+        return {'score': score, 'criteria': values, 'subjects': subjects, 'occluded': occluded,
+                'ms': (time.perf_counter() - start) * 1000}
+
+    def score_view(self, camera_spec):
+        return self.score(self.place(camera_spec))
+
+    def target(self, role='character'):
+        """Bounding box centre of one role's subjects, or of every subject when the spec has none of that role"""
+        corners = [c for r, subject_corners in self.subjects.values() if r == role for c in subject_corners]
+        corners = corners or [c for _, subject_corners in self.subjects.values() for c in subject_corners]
+        return Vector([(min(c[i] for c in corners) + max(c[i] for c in corners)) / 2 for i in range(3)])
+
+
+def score_views(spec, views, scene=None, occlusion_grid=OCCLUSION_GRID):
+    """Score every sweep view of spec against the built scene, best first"""
+    scorer = FramingScorer(spec, scene, occlusion_grid)
+    try:
+        results = [(view['name'], scorer.score_view(view_camera(spec, view))) for view in views]
+    finally:
+        scorer.close()
+    return sorted(results, key=lambda item: item[1]['score'], reverse=True)
+
+
+def print_scores(results):
+    print(f"\n   {'view':<20} {'score':>6}  " + " ".join(f"{key[:12]:>12}" for key in WEIGHTS) + f" {'ms':>6}")
+    for name, result in results:
+        values = " ".join(f"{result['criteria'][key]:12.2f}" if key in result['criteria'] else f"{'-':>12}"
+                          for key in WEIGHTS)
+        print(f"   {name:<20} {result['score']:6.2f}  {values} {result['ms']:6.2f}")
+    for name, result in results:
+        if result['occluded']:
+            hidden = ", ".join(f"{subject} {result['subjects'][subject]['visible']:.0%} visible"
+                               for subject in result['occluded'])
+            print(f"   🚫 {name}: occluded ({hidden})")
+
+
+if __name__ == "__main__":
+    args = script_args()
+    spec = load_spec(args[0] if args and not args[0].startswith('--') else "framing_test")
+    views = spec.get('views') or ([dict(spec['camera'], name=spec['name'])] if spec.get('camera') else [])
+    if not views:
+        sys.exit(f"❌ Spec '{spec['name']}' has neither views nor a camera to score")
+    # Sweep specs such as framing_test have no output; scoring only builds the scene and never renders
+    preset = RenderPreset(spec)
+    print(f"📐 Framing scores: {preset.title}")
+    print("=" * 50)
+    preset.prepare_scene()
+    print_scores(score_views(spec, views, occlusion_grid=int(script_option('--grid', OCCLUSION_GRID))))
+    print("=" * 50)
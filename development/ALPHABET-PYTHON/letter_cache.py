@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Letter Mesh Cache
+Loads each font once and converts each letter body to a mesh once, kept in a local .blend library
+"""
+
+import hashlib
+import os
+
+import bpy
+
+from scene_builder import id_alive
+from scene_spec import atomic_write
+
+LIBRARY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "letter_meshes")
+
+
+class LetterMeshCache:
+    def __init__(self, library_dir=LIBRARY_DIR):
+        self.library_dir = library_dir
+        self.fonts = {}
+        self.meshes = {}
+        self.stats = {'memory': 0, 'library': 0, 'converted': 0}
+
+    # ----------------------------------------
+    # FONTS
+    # ----------------------------------------
+    def load_font(self, font_path):
+        """Load a font once per path; None falls back to Blender's built-in font"""
+        font = self.fonts.get(font_path)
+        if font is not None and id_alive(font):
+            return font
+        try:
+            font = bpy.data.fonts.load(font_path, check_existing=True)
+        except Exception as e:
+            print(f"⚠️ Could not load font '{font_path}': {e}")
+            font = None
+        self.fonts[font_path] = font
+        return font
+
+    # ----------------------------------------
+    # LETTER MESHES
+    # ----------------------------------------
+    def mesh_name(self, font_path, letter, size, extrude, bevel_depth, bevel_resolution):
+        """Stable datablock name for one (font, letter, size, extrude, bevel) combination"""
+        key = repr((os.path.normcase(font_path or ""), letter, round(size, 4), round(extrude, 4),
+                    round(bevel_depth, 4), bevel_resolution))
+        return f"Letter_{ord(letter):04x}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}"
+
+    def library_path(self, name):
+        return os.path.join(self.library_dir, f"{name}.blend")
+
+    def get_mesh(self, font_path, letter, size=1.0, extrude=0.0, bevel_depth=0.0, bevel_resolution=None):
+        """Letter body mesh from memory, the .blend library, or a one-off curve conversion"""
+        name = self.mesh_name(font_path, letter, size, extrude, bevel_depth, bevel_resolution)
+
+        mesh = self.meshes.get(name)
+        if mesh is None or not id_alive(mesh):
+            mesh = bpy.data.meshes.get(name)
+        if mesh is not None:
+            self.stats['memory'] += 1
+        else:
+            mesh = self.load_from_library(name)
+            if mesh is not None:
+                self.stats['library'] += 1
+            else:
+                mesh = self.convert_letter(name, font_path, letter, size, extrude, bevel_depth, bevel_resolution)
+                self.save_to_library(mesh)
+                self.stats['converted'] += 1
+
+        self.meshes[name] = mesh
+        return mesh
+
+    def load_from_library(self, name):
+        path = self.library_path(name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+                data_to.meshes = [n for n in data_from.meshes if n == name]
+        except Exception as e:
+            print(f"⚠️ Could not read letter library '{path}': {e}")
+            return None
+        return data_to.meshes[0] if data_to.meshes else None
+
+    def save_to_library(self, mesh):
+        os.makedirs(self.library_dir, exist_ok=True)
+        path = self.library_path(mesh.name)
+        # Parallel Blender processes never read half a file
+        try:
+            with atomic_write(path) as temp_path:
+                bpy.data.libraries.write(temp_path, {mesh}, fake_user=True)
+        except Exception as e:
+            print(f"⚠️ Could not store letter mesh '{mesh.name}': {e}")
+
+    def convert_letter(self, name, font_path, letter, size, extrude, bevel_depth, bevel_resolution):
+        """Evaluate a temporary text curve and keep the tessellated result as a mesh"""
+        print(f"🔤 [Letters] Converting '{letter}' to a cached mesh...")
+        curve = bpy.data.curves.new(name, type='FONT')
+        curve.body = letter
+        curve.size = size
+        curve.extrude = extrude
+        curve.bevel_depth = bevel_depth
+        if bevel_resolution is not None:
+            curve.bevel_resolution = bevel_resolution
+        font = self.load_font(font_path)
+        if font:
+            curve.font = font
+
+        temp = bpy.data.objects.new(name, curve)
+        bpy.context.scene.collection.objects.link(temp)
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh = bpy.data.meshes.new_from_object(temp.evaluated_get(depsgraph))
+        bpy.data.objects.remove(temp, do_unlink=True)
+        bpy.data.curves.remove(curve)
+
+        mesh.name = name
+        # Empty slot so each letter object carries its own material
+        mesh.materials.append(None)
+        return mesh
+
+    def report(self):
+        print(f"🔤 [Letters] {self.stats['memory']} from memory, {self.stats['library']} from library, "
+              f"{self.stats['converted']} converted")
+
+
+_shared_cache = None
+
+
+def shared_letter_cache():
+    """Letter cache shared by every scene builder in this Blender session"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = LetterMeshCache()
+    return _shared_cache
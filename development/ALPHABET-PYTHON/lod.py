@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Level of Detail
+Picks pooled mesh resolution per object from its projected size through the active camera
+"""
+
+import math
+
+import bpy
+from mathutils import Vector
+
+# Pooled segment counts the LOD stage may switch between; fewer levels keep the pool small
+LOD_LEVELS = (6, 8, 12, 16, 24, 32)
+
+# Silhouette pixels covered by one segment before faceting becomes visible
+PIXELS_PER_SEGMENT = 6.0
+
+# Objects smaller than this on screen stop casting shadows
+SUBPIXEL = 1.0
+
+
+def render_size(scene):
+    scale = scene.render.resolution_percentage / 100.0
+    return scene.render.resolution_x * scale, scene.render.resolution_y * scale
+
+
+def projected_pixels(scene, camera, location, radius):
+    """On-screen diameter in pixels of a sphere at location; None when it is behind the camera"""
+    data = camera.data
+    width, height = render_size(scene)
+    if data.type == 'ORTHO':
+        return 2 * radius / data.ortho_scale * max(width, height)
+
+    depth = -(camera.matrix_world.inverted() @ Vector(location)).z
+    if depth <= data.clip_start:
+        return None
+    if data.sensor_fit == 'VERTICAL':
+        sensor, pixels = data.sensor_height, height
+    elif data.sensor_fit == 'HORIZONTAL':
+        sensor, pixels = data.sensor_width, width
+    else:
+        sensor, pixels = data.sensor_width, max(width, height)
+    focal_pixels = data.lens / sensor * pixels
+    return 2 * radius / depth * focal_pixels
+
+
+def lod_segments(pixels, authored):
+    """Smallest pooled level whose segments stay under PIXELS_PER_SEGMENT, capped at the authored count"""
+    needed = math.pi * pixels / PIXELS_PER_SEGMENT
+    for level in LOD_LEVELS:
+        if level >= needed:
+            return min(level, authored)
+    return authored
+
+
+def set_shadow(obj, casts):
+    if hasattr(obj, 'visible_shadow'):
+        obj.visible_shadow = casts
+    else:
+        # Blender < 3.0 keeps ray visibility on the Cycles settings
+        obj.cycles_visibility.shadow = casts
+
+
+def casts_shadow(obj):
+    if hasattr(obj, 'visible_shadow'):
+        return obj.visible_shadow
+    return obj.cycles_visibility.shadow
+
+
+def max_projected_pixels(scene, cameras, location, radius):
+    """Largest on-screen size over several cameras; None when the point is behind all of them"""
+    sizes = [p for p in (projected_pixels(scene, camera, location, radius) for camera in cameras) if p is not None]
+    return max(sizes) if sizes else None
+
+
+def apply_lod(builder, scene=None, cameras=None):
+    """Swap pooled sphere/cylinder meshes to the resolution the cameras can resolve; the nearest view wins"""
+    scene = scene if scene is not None else bpy.context.scene
+    cameras = cameras if cameras is not None else [scene.camera]
+    cameras = [camera for camera in cameras if camera is not None]
+    if not cameras:
+        return None
+
+    # Transforms set through the data API are only reflected in matrix_world after an update
+    bpy.context.view_layer.update()
+    stats = {'objects': 0, 'reduced': 0, 'shadowless': 0, 'vertices_saved': 0}
+    for obj in scene.objects:
+        primitive = obj.get("primitive")
+        if primitive is None or obj.type != 'MESH':
+            continue
+        stats['objects'] += 1
+
+        pixels = max_projected_pixels(scene, cameras, obj.matrix_world.translation, 0.5 * max(obj.dimensions))
+        casts = pixels is None or pixels >= SUBPIXEL
+        set_shadow(obj, casts)
+        if not casts:
+            stats['shadowless'] += 1
+
+        authored = obj.get("segments", 0)
+        if not authored or pixels is None:
+            continue
+        segments = lod_segments(pixels, authored)
+        mesh = builder.pooled_mesh(primitive, segments)
+        if obj.data != mesh:
+            material = obj.material_slots[0].material if obj.material_slots else None
+            stats['vertices_saved'] += len(obj.data.vertices) - len(mesh.vertices)
+            obj.data = mesh
+            if material:
+                builder.set_object_material(obj, material)
+        obj["lod_segments"] = segments
+        if segments < authored:
+            stats['reduced'] += 1
+
+    print(f"🔭 [LOD] {stats['objects']} objects: {stats['reduced']} reduced, {stats['shadowless']} shadowless, "
+          f"{stats['vertices_saved']} vertices saved")
+    return stats
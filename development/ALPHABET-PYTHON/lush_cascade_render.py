@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Lush Cascade Render
+Ultimate cascade scene with thousands of seeded, instanced trees, plants and rocks
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from render_preset import RenderPreset
+
+class LushCascadeRender(RenderPreset):
+    # Scatter layers and prototypes live in scene_specs/lush_cascade.json
+    spec_name = "lush_cascade"
+
+# Run it
+if __name__ == "__main__":
+    LushCascadeRender().run()
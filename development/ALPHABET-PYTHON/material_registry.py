@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Material Registry
+Deduplicates flat, PBR and water materials so each unique material compiles once
+"""
+
+import json
+
+import bpy
+
+from scene_builder import id_alive
+
+
+class MaterialRegistry:
+    def __init__(self):
+        self.materials = {}
+        self.hits = 0
+        self.misses = 0
+
+    # ----------------------------------------
+    # KEYS AND LOOKUP
+    # ----------------------------------------
+    def make_key(self, kind, name, **params):
+        """Stable key from the material kind, name and rounded parameters"""
+        def normalize(value):
+            if isinstance(value, (list, tuple)):
+                return [normalize(v) for v in value]
+            if isinstance(value, float):
+                return round(value, 4)
+            return value
+        return json.dumps([kind, name, {k: normalize(v) for k, v in params.items()}], sort_keys=True)
+
+    def lookup(self, key):
+        """Return the live material for a key, including ones built earlier in this Blender session"""
+        mat = self.materials.get(key)
+        if mat is not None and id_alive(mat):
+            return mat
+        for existing in bpy.data.materials:
+            if existing.get("registry_key") == key:
+                self.materials[key] = existing
+                return existing
+        return None
+
+    def get_or_create(self, key, name, build):
+        mat = self.lookup(key)
+        if mat is not None:
+            self.hits += 1
+            return mat
+        self.misses += 1
+        mat = build(bpy.data.materials.new(name))
+        mat["registry_key"] = key
+        self.materials[key] = mat
+        return mat
+
+    # ----------------------------------------
+    # MATERIAL KINDS
+    # ----------------------------------------
+    def flat(self, name, color):
+        """Viewport-colour material without nodes"""
+        def build(mat):
+            mat.use_nodes = False
+            mat.diffuse_color = (*color[:3], 1.0)
+            return mat
+        return self.get_or_create(self.make_key('flat', name, color=tuple(color[:3])), name, build)
+
+    def pbr(self, name, base_color, metallic=0.0, roughness=0.5, specular=0.5):
+        """Create professional PBR material"""
+        def build(mat):
+            mat.use_nodes = True
+            nodes = mat.node_tree.nodes
+            links = mat.node_tree.links
+
+            # Clear default nodes
+            nodes.clear()
+
+            # Create principled BSDF
+            principled = nodes.new('ShaderNodeBsdfPrincipled')
+            principled.inputs['Base Color'].default_value = (*base_color, 1.0)
+            principled.inputs['Metallic'].default_value = metallic
+            principled.inputs['Roughness'].default_value = roughness
+            # Note: Specular input might not exist in all Blender versions
+            if 'Specular' in principled.inputs:
+                principled.inputs['Specular'].default_value = specular
+
+            # Create output
+            output = nodes.new('ShaderNodeOutputMaterial')
+
+            # Link nodes
+            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+            return mat
+        key = self.make_key('pbr', name, base_color=tuple(base_color), metallic=metallic,
+                            roughness=roughness, specular=specular)
+        return self.get_or_create(key, name, build)
+
+    def water(self, name, color=(0.2, 0.6, 0.9), ior=1.33, transparency=0.3):
+        """Create professional water material with transparency"""
+        def build(mat):
+            mat.use_nodes = True
+            nodes = mat.node_tree.nodes
+            links = mat.node_tree.links
+
+            nodes.clear()
+
+            # Glass BSDF for water
+            glass = nodes.new('ShaderNodeBsdfGlass')
+            glass.inputs['Color'].default_value = (*color, 1.0)
+            glass.inputs['Roughness'].default_value = 0.0
+            glass.inputs['IOR'].default_value = ior
+
+            # Mix with transparent for better water look
+            transparent = nodes.new('ShaderNodeBsdfTransparent')
+            mix = nodes.new('ShaderNodeMixShader')
+            mix.inputs[0].default_value = transparency
+
+            output = nodes.new('ShaderNodeOutputMaterial')
+
+            links.new(glass.outputs['BSDF'], mix.inputs[1])
+            links.new(transparent.outputs['BSDF'], mix.inputs[2])
+            links.new(mix.outputs['Shader'], output.inputs['Surface'])
+            return mat
+        key = self.make_key('water', name, color=tuple(color), ior=ior, transparency=transparency)
+        return self.get_or_create(key, name, build)
+
+    def report(self):
+        print(f"🎨 [Materials] {len(self.materials)} unique, {self.hits} reused, {self.misses} created")
+
+
+_shared_registry = None
+
+
+def shared_registry():
+    """Registry shared by every scene builder in this Blender session"""
+    global _shared_registry
+    if _shared_registry is None:
+        _shared_registry = MaterialRegistry()
+    return _shared_registry
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Occlusion
+Visible fraction of key objects per camera, from rays cast at sample points on their surfaces
+"""
+
+import math
+
+import bpy
+from bpy_extras.object_utils import world_to_camera_view
+from mathutils import Matrix, Vector
+
+# Sample points per bounding box axis of each object, snapped onto its surface; 0 disables ray casting
+OCCLUSION_GRID = 3
+
+# Cap per subject so subjects made of many parts (eyes, arms) cost no more rays than a single body
+MAX_SAMPLES = 64
+
+# Rays stop this fraction short of their sample so the sampled surface itself is not hit
+SURFACE_OFFSET = 1e-3
+
+# World-space distance within which a ray hit's instance matrix is taken to be a subject's own rig part
+INSTANCE_TOLERANCE = 1e-4
+
+
+def surface_samples(obj, depsgraph, grid):
+    """World-space points on an object's evaluated mesh, from a grid through its bounding box"""
+    evaluated = obj.evaluated_get(depsgraph)
+    low = [min(corner[i] for corner in obj.bound_box) for i in range(3)]
+    high = [max(corner[i] for corner in obj.bound_box) for i in range(3)]
+    steps = [(i + 0.5) / grid for i in range(grid)]
+    points = []
+    for fx in steps:
+        for fy in steps:
+            for fz in steps:
+                local = Vector([low[i] + (high[i] - low[i]) * f for i, f in enumerate((fx, fy, fz))])
+                found, location, _, _ = evaluated.closest_point_on_mesh(local)
+                if found:
+                    points.append(obj.matrix_world @ location)
+    return points
+
+
+class OcclusionEstimator:
+    def __init__(self, subjects, scene=None, grid=OCCLUSION_GRID):
+        self.scene = scene if scene is not None else bpy.context.scene
+        self.depsgraph = bpy.context.evaluated_depsgraph_get()
+        # Sample points do not depend on the camera; only the rays are cast per camera
+        self.samples = {}
+        for name, object_names in subjects.items():
+            found = [obj for obj in map(bpy.data.objects.get, object_names) if obj is not None]
+            objects = [obj for obj in found if obj.type == 'MESH']
+            # Shared rig parts are hit as their template objects; the instancer tells whose they are
+            instancers = [(obj.matrix_world.copy(), obj.instance_collection) for obj in found
+                          if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None]
+            points = [point for obj in objects for point in surface_samples(obj, self.depsgraph, grid)]
+            stride = math.ceil(len(points) / MAX_SAMPLES) if points else 1
+            self.samples[name] = (set(obj.name for obj in objects), instancers, points[::stride])
+
+    @staticmethod
+    def own_hit(hit_object, hit_matrix, own_objects, instancers):
+        """Whether a ray hit lands on the subject itself, including parts of its own collection instances"""
+        if hit_object.name in own_objects:
+            return True
+        for matrix, collection in instancers:
+            if hit_object.name not in collection.all_objects:
+                continue
+            # Where this instancer would place the template part; another letter's rig puts it elsewhere
+            expected = matrix @ Matrix.Translation(-collection.instance_offset) @ hit_object.matrix_world
+            if (expected.translation - hit_matrix.translation).length < INSTANCE_TOLERANCE:
+                return True
+        return False
+
+    def visible_fraction(self, camera, name):
+        """Share of in-frame samples whose camera ray hits nothing but the subject; None with no samples in frame"""
+        own_objects, instancers, points = self.samples[name]
+        origin = camera.matrix_world.translation
+        clip_start, clip_end = camera.data.clip_start, camera.data.clip_end
+        in_frame = visible = 0
+        for point in points:
+            projected = world_to_camera_view(self.scene, camera, point)
+            if not (0.0 <= projected.x <= 1.0 and 0.0 <= projected.y <= 1.0 and clip_start < projected.z < clip_end):
+                continue
+            in_frame += 1
+            direction = point - origin
+            distance = direction.length
+            hit, _, _, _, hit_object, hit_matrix = self.scene.ray_cast(
+                self.depsgraph, origin, direction.normalized(), distance=distance * (1 - SURFACE_OFFSET))
+            # The subject hiding its own back faces, or its body behind its own eyes and limbs, is not occlusion
+            if not hit or self.own_hit(hit_object, hit_matrix, own_objects, instancers):
+                visible += 1
+        return visible / in_frame if in_frame else None
+
+    def estimate(self, camera):
+        """Visible fraction per subject with samples in frame; framing outside the frame is the projection's job"""
+        fractions = {name: self.visible_fraction(camera, name) for name in self.samples}
+        return {name: fraction for name, fraction in fractions.items() if fraction is not None}
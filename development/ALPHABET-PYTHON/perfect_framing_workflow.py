@@ -211,7 +211,7 @@ def run_final_render():
     
     print("🚀 Running the final render script...")
     print("💡 Please run this command in Blender:")
-    print("   blender --background --python ultimate_cascade_render.py")
+    print("   blender --background --python ultimate_cascade_render.py -- --tier final")
     print("\n⏳ Waiting for final render to complete...")
     
     input("Press Enter when final render is complete...")
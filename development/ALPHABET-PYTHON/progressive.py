@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Progressive Render
+Cheap preview passes written next to the final output, with a progress file downstream tools can poll
+"""
+
+import os
+
+import bpy
+import numpy as np
+
+from quality_tiers import TIERS
+from scene_spec import save_json
+
+# A preview brighter than this everywhere, or flatter than this, is not worth refining
+WHITE_LEVEL = 0.95
+FLAT_DEVIATION = 0.01
+
+
+def progressive_tiers(tier):
+    """Every tier up to and including the target, cheapest first"""
+    order = list(TIERS)
+    return order[:order.index(tier) + 1]
+
+
+def pass_path(output_path, index):
+    """references/.../render.png -> references/.../render.pass1.png"""
+    stem, ext = os.path.splitext(output_path)
+    return f"{stem}.pass{index}{ext}"
+
+
+def progress_path(output_path):
+    return f"{os.path.splitext(output_path)[0]}.progress.json"
+
+
+def write_progress(output_path, progress):
+    """Atomic, so a poller never reads half a file"""
+    save_json(progress_path(output_path), progress)
+
+
+def frame_problem(path):
+    """'all white' or 'empty frame' when a rendered image is clearly broken, None when it looks usable"""
+    image = bpy.data.images.load(path)
+    try:
+        pixels = np.empty(len(image.pixels), dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+    finally:
+        bpy.data.images.remove(image)
+    rgb = pixels.reshape(-1, 4)[:, :3]
+    if rgb.mean() > WHITE_LEVEL:
+        return "all white"
+    if rgb.std() < FLAT_DEVIATION:
+        return "empty frame"
+    return None
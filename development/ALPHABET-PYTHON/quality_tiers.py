@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Quality Tiers
+Named render presets layered over a spec's render section, picked with --tier after "--"
+"""
+
+# Iteration runs and camera sweeps render at draft; pass --tier final for the full-resolution render
+DEFAULT_TIER = 'draft'
+
+# Overrides mirror the spec's render section; 'width' sets the long edge and keeps the spec's aspect ratio.
+# final carries no overrides. EEVEE shadow maps, GTAO and bloom follow the resulting resolution (eevee_quality.py).
+TIERS = {
+    'thumbnail': {
+        'width': 480,
+        'eevee': {'taa_render_samples': 8},
+        'cycles': {'samples': 16, 'adaptive_threshold': 0.1, 'use_denoising': True},
+    },
+    'draft': {
+        'width': 960,
+        'eevee': {'taa_render_samples': 32},
+        'cycles': {'samples': 64, 'adaptive_threshold': 0.05, 'use_denoising': True},
+    },
+    'preview': {
+        'width': 1920,
+        'eevee': {'taa_render_samples': 64},
+        'cycles': {'samples': 128, 'adaptive_threshold': 0.02, 'use_denoising': True},
+    },
+    'final': {},
+}
+
+
+def tier_settings(name, render_spec):
+    """Settings to apply after the spec's render section; never upscales past the spec's resolution"""
+    if name not in TIERS:
+        raise ValueError(f"Unknown quality tier: {name} (expected one of {', '.join(TIERS)})")
+    tier = TIERS[name]
+    settings = {key: dict(value) for key, value in tier.items() if key != 'width'}
+    if 'width' in tier:
+        spec_x = render_spec.get('render', {}).get('resolution_x', 1920)
+        spec_y = render_spec.get('render', {}).get('resolution_y', 1080)
+        width = min(tier['width'], spec_x)
+        settings['render'] = {'resolution_x': width, 'resolution_y': round(width * spec_y / spec_x),
+                              'resolution_percentage': 100}
+    return settings
+
+
+def tier_arg(args, default=DEFAULT_TIER):
+    """Tier named by '--tier NAME' or '--tier=NAME' in the script arguments"""
+    for i, arg in enumerate(args):
+        if arg.startswith('--tier='):
+            return arg.split('=', 1)[1]
+        if arg == '--tier' and i + 1 < len(args):
+            return args[i + 1]
+    return default
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Region Render
+Splits a frame into cost-balanced border regions, renders them in separate Blender processes and stitches the result
+
+Coordinator (builds the cost map, starts local workers, stitches):
+    blender --background --python region_render.py -- professional_grade --regions 8 --workers 4
+Extra hosts sharing the job directory:
+    blender --background --python region_render.py -- --worker /shared/jobs/professional_grade_final_...
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_tiers import tier_arg
+from render_preset import RenderPreset, script_args, script_option
+from scene_spec import SCRIPT_DIR, atomic_write, load_spec, save_json, spec_hash
+
+REGION_DIR = os.path.join(SCRIPT_DIR, "cache", "regions")
+
+# Horizontal preview strips timed for the cost map, rendered at the cheapest tier
+COST_ROWS = 16
+COST_TIER = 'thumbnail'
+
+POLL_SECONDS = 2.0
+
+# A claim without a tile this old is abandoned; claims from this host are checked against their pid instead
+STALE_CLAIM_SECONDS = 6 * 3600
+
+# The coordinator gives up when no new tile appears for this long (override with --stall-timeout)
+STALL_SECONDS = 2 * STALE_CLAIM_SECONDS
+
+# Rows rendered past each band edge and cropped after denoising, so the denoiser sees across the seams
+OVERLAP_ROWS = 32
+
+
+# ----------------------------------------
+# COST MAP AND REGIONS
+# ----------------------------------------
+def set_border(render, row0, row1, height):
+    """Crop the render to pixel rows [row0, row1), counted from the bottom like Blender's border"""
+    render.use_border = True
+    render.use_crop_to_border = True
+    render.border_min_x, render.border_max_x = 0.0, 1.0
+    # Blender truncates border * height, so aim at pixel centres to land on exact rows
+    render.border_min_y = min((row0 + 0.5) / height, 1.0)
+    render.border_max_y = min((row1 + 0.5) / height, 1.0)
+
+
+def measure_cost_map(preset, rows=COST_ROWS):
+    """Seconds per preview strip, bottom-up, with the fixed per-render overhead taken out"""
+    print(f"⏱️ [Regions] Timing {rows} preview strips at the {COST_TIER} tier...")
+    scene = bpy.context.scene
+    preset.compiler.tier = COST_TIER
+    preset.compiler.setup_render_settings()
+    scene.render.use_persistent_data = True
+    times = []
+    for row in range(rows):
+        set_border(scene.render, row, row + 1, rows)
+        start = time.perf_counter()
+        bpy.ops.render.render()
+        times.append(time.perf_counter() - start)
+    scene.render.use_border = False
+    floor = min(times)
+    # Keep every strip above zero so cheap sky rows still get a share of the frame
+    return [t - floor + 0.05 * floor + 1e-3 for t in times]
+
+
+def cost_map(preset):
+    """Cost map cached per spec, since lights and camera change the cost as much as geometry"""
+    path = os.path.join(REGION_DIR, f"{preset.spec['name']}_{spec_hash(preset.spec)[:16]}_cost.json")
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    costs = measure_cost_map(preset)
+    save_json(path, costs)
+    return costs
+
+
+def balanced_regions(costs, count, height):
+    """Split [0, height) into count bands of roughly equal estimated cost"""
+    total = sum(costs)
+    strips = len(costs)
+    bounds = [0]
+    for k in range(1, count):
+        target = total * k / count
+        acc = 0.0
+        y = 1.0
+        for i, cost in enumerate(costs):
+            if acc + cost >= target:
+                # Cost is spread evenly inside a strip
+                y = (i + (target - acc) / cost) / strips
+                break
+            acc += cost
+        bounds.append(min(max(round(y * height), bounds[-1] + 1), height - (count - k)))
+    bounds.append(height)
+    return list(zip(bounds, bounds[1:]))
+
+
+def tile_rows(row0, row1, height, overlap=OVERLAP_ROWS):
+    """Rows a region's tile renders: the band plus overlap rows on each side, within the frame"""
+    return max(row0 - overlap, 0), min(row1 + overlap, height)
+
+
+# ----------------------------------------
+# JOBS
+# ----------------------------------------
+def tile_path(job_dir, index):
+    return os.path.join(job_dir, f"region_{index:03d}.png")
+
+
+def claim_path(job_dir, index):
+    return os.path.join(job_dir, f"region_{index:03d}.claim")
+
+
+def claim(job_dir, index):
+    """Atomically take a region; works across hosts on a shared directory"""
+    try:
+        fd = os.open(claim_path(job_dir, index), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, 'w') as f:
+        f.write(f"{socket.gethostname()}:{os.getpid()}")
+    return True
+
+
+def process_alive(pid):
+    """Whether a local process exists; None when that cannot be checked safely"""
+    if os.name == 'nt':
+        # os.kill on Windows terminates the process instead of probing it
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def claim_stale(path):
+    """A claim whose worker on this host has exited, or one too old to still be rendering"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            host, _, pid = f.read().strip().rpartition(':')
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
+        return False
+    if host == socket.gethostname() and pid.isdigit():
+        alive = process_alive(int(pid))
+        if alive is not None:
+            return not alive
+    return age > STALE_CLAIM_SECONDS
+
+
+def prepare_job_dir(job_dir, job):
+    """Write the job; tiles of an identical earlier job are reused, anything else is cleared"""
+    os.makedirs(job_dir, exist_ok=True)
+    job_path = os.path.join(job_dir, "job.json")
+    if os.path.exists(job_path):
+        with open(job_path, encoding='utf-8') as f:
+            previous = json.load(f)
+        if previous != job:
+            for name in os.listdir(job_dir):
+                if name.startswith("region_"):
+                    os.remove(os.path.join(job_dir, name))
+    # Remote workers read the job from the shared directory
+    save_json(job_path, job)
+
+    # Claims without a tile were left by a crashed run, unless their worker is still rendering
+    release_stale_claims(job_dir, range(len(job['regions'])))
+
+
+def release_stale_claims(job_dir, indices):
+    """Remove abandoned claims on regions that have no tile yet; returns the released indices"""
+    released = []
+    for index in indices:
+        path = claim_path(job_dir, index)
+        if os.path.exists(path) and not os.path.exists(tile_path(job_dir, index)) and claim_stale(path):
+            print(f"🧹 [Regions] Releasing stale claim on region {index}")
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another coordinator or the worker itself got there first
+                continue
+            released.append(index)
+    return released
+
+
+def run_worker(job_dir):
+    """Render unclaimed regions of a job; False when the spec here does not match the coordinator's"""
+    with open(os.path.join(job_dir, "job.json"), encoding='utf-8') as f:
+        job = json.load(f)
+    spec = load_spec(job['spec'])
+    if spec_hash(spec) != job['spec_hash']:
+        # Tiles from another version of the spec would be stitched without any visible error
+        print(f"❌ Spec '{job['spec']}' on {socket.gethostname()} differs from the coordinator's; not rendering")
+        return False
+    preset = RenderPreset(spec, tier=job['tier'])
+    preset.prepare_scene()
+    render = bpy.context.scene.render
+    rendered = 0
+    for index, (row0, row1) in enumerate(job['regions']):
+        if not claim(job_dir, index):
+            continue
+        print(f"🧩 [Regions] Rendering region {index} (rows {row0}-{row1})")
+        set_border(render, *tile_rows(row0, row1, job['height'], job['overlap']), job['height'])
+        try:
+            with atomic_write(tile_path(job_dir, index)) as temp_path:
+                preset.render(output_path=temp_path)
+        except Exception:
+            # Free the region for another worker, or the coordinator waits on it forever
+            os.remove(claim_path(job_dir, index))
+            raise
+        rendered += 1
+    print(f"✅ Worker {socket.gethostname()}:{os.getpid()} rendered {rendered} regions")
+    return True
+
+
+def stitch(job_dir, job, output_path):
+    """Paste each tile's band, minus its overlap rows, into one frame; pixels are bottom-up rows, like the border"""
+    print("🧵 [Regions] Stitching...")
+    frame = np.zeros((job['height'], job['width'], 4), dtype=np.float32)
+    for index, (row0, row1) in enumerate(job['regions']):
+        image = bpy.data.images.load(tile_path(job_dir, index))
+        # Tiles are already view-transformed; read them as stored so they are written back unchanged
+        image.colorspace_settings.name = 'Non-Color'
+        width, height = image.size
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        offset = row0 - tile_rows(row0, row1, job['height'], job['overlap'])[0]
+        rows = min(row1 - row0, height - offset)
+        frame[row0:row0 + rows, :width] = pixels.reshape(height, width, 4)[offset:offset + rows]
+        bpy.data.images.remove(image)
+
+    stitched = bpy.data.images.new("RegionRender", job['width'], job['height'], alpha=True, float_buffer=True)
+    stitched.colorspace_settings.name = 'Non-Color'
+    stitched.pixels.foreach_set(frame.ravel())
+    # The scene's output format and color depth, as a single-process render would have written
+    with atomic_write(output_path) as temp_path:
+        stitched.save_render(temp_path, scene=bpy.context.scene)
+    bpy.data.images.remove(stitched)
+    print(f"✅ Stitched render saved to {output_path}")
+
+
+# ----------------------------------------
+# COORDINATOR
+# ----------------------------------------
+def run_coordinator(spec_name, count, workers, tier, job_dir=None, stall_seconds=STALL_SECONDS):
+    spec = load_spec(spec_name)
+    preset = RenderPreset(spec, tier=COST_TIER)
+    print(f"🚀 Region render: {preset.title} [{tier}], {count} regions, {workers} local workers")
+    print("=" * 50)
+
+    preset.prepare_scene()
+    costs = cost_map(preset)
+    preset.compiler.tier = tier
+    preset.compiler.setup_render_settings()
+    render = bpy.context.scene.render
+    width = int(render.resolution_x * render.resolution_percentage / 100)
+    height = int(render.resolution_y * render.resolution_percentage / 100)
+    regions = balanced_regions(costs, count, height)
+    print(f"📐 [Regions] {width}x{height} split at rows {[row0 for row0, _ in regions[1:]]}")
+
+    job = {'spec': spec_name, 'spec_hash': spec_hash(spec), 'tier': tier, 'width': width, 'height': height,
+           'regions': [list(region) for region in regions], 'overlap': OVERLAP_ROWS}
+    shared = job_dir is not None
+    job_dir = job_dir or os.path.join(REGION_DIR, f"{spec_name}_{tier}_{spec_hash(job)[:16]}")
+    prepare_job_dir(job_dir, job)
+
+    # Split the cores between local workers instead of letting each one grab them all
+    threads = max(1, (os.cpu_count() or 1) // max(workers, 1))
+    # Without --python-exit-code a script exception still exits 0
+    command = [bpy.app.binary_path, "--background", "--threads", str(threads), "--python-exit-code", "1",
+               "--python", os.path.abspath(__file__), "--", "--worker", job_dir]
+    processes = [subprocess.Popen(command) for _ in range(workers)]
+
+    start = last_tile = time.perf_counter()
+    done = 0
+    while True:
+        missing = [i for i in range(count) if not os.path.exists(tile_path(job_dir, i))]
+        if not missing:
+            break
+        if count - len(missing) > done:
+            done, last_tile = count - len(missing), time.perf_counter()
+        elif time.perf_counter() - last_tile > stall_seconds:
+            print(f"❌ No new region in {stall_seconds:.0f}s; regions {missing} unrendered")
+            return False
+        # A worker killed mid-region leaves its claim behind; free the region and start someone to take it
+        if release_stale_claims(job_dir, missing) and all(p.poll() is not None for p in processes):
+            processes.append(subprocess.Popen(command))
+        if all(p.poll() is not None for p in processes) and not shared:
+            print(f"❌ Local workers exited with regions {missing} unrendered")
+            return False
+        time.sleep(POLL_SECONDS)
+    print(f"✅ {count} regions rendered in {time.perf_counter() - start:.1f}s")
+
+    stitch(job_dir, job, preset.output_path)
+    print("=" * 50)
+    return True
+
+
+if __name__ == "__main__":
+    args = script_args()
+    if '--worker' in args:
+        ok = run_worker(script_option('--worker'))
+    else:
+        ok = run_coordinator(args[0] if args and not args[0].startswith('--') else 'professional_grade',
+                             int(script_option('--regions', 8)), int(script_option('--workers', 4)),
+                             tier_arg(args, default='final'), script_option('--job-dir'),
+                             float(script_option('--stall-timeout', STALL_SECONDS)))
+    # A refused or failed run must not pass for success
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Render Cache
+Finished renders keyed by every input that changes their pixels, evicted least-recently-used by disk size
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+
+from quality_tiers import TIERS
+from scene_spec import BUILDER_MODULES, SCRIPT_DIR, UNRENDERED_SECTIONS, atomic_write, save_json, source_digest, spec_hash
+
+CACHE_DIR = os.path.join(SCRIPT_DIR, "cache", "renders")
+
+# Version strings of Blender binaries seen so far, so cache lookups do not start Blender
+VERSIONS_PATH = os.path.join(SCRIPT_DIR, "cache", "blender_versions.json")
+
+# Renders are small next to scenes; override with RENDER_CACHE_MB
+MAX_BYTES = int(os.environ.get('RENDER_CACHE_MB', 2048)) * 1024 * 1024
+
+# Builder code plus everything that turns a built scene into pixels
+RENDER_MODULES = BUILDER_MODULES + ('quality_tiers.py', 'eevee_quality.py', 'cycles_sampling.py', 'autotune.py',
+                                    'render_preset.py')
+
+_source_version = None
+
+
+def source_version():
+    global _source_version
+    if _source_version is None:
+        _source_version = source_digest(RENDER_MODULES)
+    return _source_version
+
+
+def blender_version(blender_path):
+    """Version string as bpy.app.version_string reports it; asked once per binary, then read from disk"""
+    stat = os.stat(blender_path)
+    binary = f"{os.path.realpath(blender_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    try:
+        with open(VERSIONS_PATH, encoding='utf-8') as f:
+            versions = json.load(f)
+    except (OSError, ValueError):
+        versions = {}
+    if binary not in versions:
+        result = subprocess.run([blender_path, "--version"], capture_output=True, text=True, timeout=60)
+        first_line = result.stdout.strip().splitlines()[0]
+        versions[binary] = first_line.replace("Blender", "", 1).strip()
+        save_json(VERSIONS_PATH, versions)
+    return versions[binary]
+
+
+def steering_key(spec, cameras, tier, blender):
+    """Key of the camera set LOD and the EEVEE fit resolve over; order and camera names do not change the result"""
+    placements = sorted(json.dumps({k: v for k, v in camera.items() if k != 'name'}, sort_keys=True)
+                        for camera in cameras)
+    return render_key(spec, None, tier, blender, steering=placements)
+
+
+def render_key(spec, camera, tier, blender, **options):
+    """Hash of scene spec, camera, render settings, builder source and Blender version"""
+    parts = {
+        'scene': spec_hash(spec, exclude=UNRENDERED_SECTIONS),
+        'camera': camera,
+        'tier': tier,
+        'tier_settings': TIERS.get(tier),
+        'options': {key: value for key, value in options.items() if value is not None},
+        'source': source_version(),
+        'blender': blender,
+    }
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+class RenderCache:
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+
+    def path(self, key, output_path):
+        return os.path.join(self.cache_dir, f"{key}{os.path.splitext(output_path)[1] or '.png'}")
+
+    def copy(self, source, target):
+        """Copy through a temp file so readers never see a partial image"""
+        with atomic_write(target) as temp_path:
+            shutil.copyfile(source, temp_path)
+
+    # ----------------------------------------
+    # LOOKUP AND STORE
+    # ----------------------------------------
+    def fetch(self, key, output_path):
+        """Copy a cached render to output_path; False on a miss"""
+        path = self.path(key, output_path)
+        if not os.path.exists(path):
+            self.stats['misses'] += 1
+            return False
+        self.copy(path, output_path)
+        # mtime doubles as the LRU clock
+        os.utime(path)
+        self.stats['hits'] += 1
+        print(f"🗃️ [Render Cache] Hit {key[:12]} -> {output_path}")
+        return True
+
+    def store(self, key, output_path):
+        if not os.path.exists(output_path):
+            return
+        try:
+            self.copy(output_path, self.path(key, output_path))
+            self.stats['stored'] += 1
+            self.evict()
+        except OSError as e:
+            print(f"⚠️ Could not cache render '{output_path}': {e}")
+
+    def evict(self):
+        """Drop least recently used renders until the cache fits in max_bytes"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and '.tmp.' not in entry.name:
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.stats['evicted'] += 1
+
+    # ----------------------------------------
+    # RESOLVED SWEEP STATE
+    # ----------------------------------------
+    def state_path(self, key):
+        # Kept beside the renders but out of eviction, which only scans the top level
+        return os.path.join(self.cache_dir, "states", f"{key}.json")
+
+    def fetch_state(self, key):
+        """Resolved LOD and settings digest recorded for a steering key; None when not seen yet"""
+        try:
+            with open(self.state_path(key), encoding='utf-8') as f:
+                return json.load(f)['state']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store_state(self, key, state):
+        save_json(self.state_path(key), {'state': state})
+
+    def report(self):
+        print(f"🗃️ [Render Cache] {self.stats['hits']} hits, {self.stats['misses']} misses, "
+              f"{self.stats['stored']} stored, {self.stats['evicted']} evicted")
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Render Pool
+Starts long-lived Blender render workers once and spreads JSON render jobs across them
+
+    python render_pool.py camera_test --workers 2 --tier draft
+"""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from quality_tiers import DEFAULT_TIER
+from render_cache import RenderCache, blender_version, render_key, steering_key
+from scene_spec import context_cameras, find_view, job_camera, load_spec, resolve_path, spec_output
+from sweep_manifest import frame_output, write_manifest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKER_SCRIPT = os.path.join(SCRIPT_DIR, "render_worker.py")
+
+# Must match render_worker.READY; the worker module needs bpy, so it is not imported here
+READY = "RENDER_WORKER_READY"
+
+# Where the analysis scripts look for each sweep's renders
+SWEEP_DIRS = {'camera_test': "camera_tests", 'framing_test': "framing_tests"}
+
+
+def blender_binary():
+    """$BLENDER, then blender on PATH, then the usual install locations"""
+    path = os.environ.get('BLENDER') or shutil.which('blender')
+    if path:
+        return path
+    from find_blender import find_blender
+    return find_blender()
+
+
+class RenderWorkerClient:
+    def __init__(self, blender_path, log_path=None):
+        self.spec = None
+        self.blender_path = blender_path
+        self.log_path = log_path
+        self.process = subprocess.Popen(
+            [blender_path, "--background", "--python", WORKER_SCRIPT, "--", "--port", "0"],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, encoding='utf-8', errors='replace')
+        self.port = self.wait_ready()
+        # Keep reading Blender's output so a full pipe never stalls a render
+        threading.Thread(target=self.drain, daemon=True).start()
+        self.connection = socket.create_connection(("127.0.0.1", self.port))
+        self.stream = self.connection.makefile('rw', encoding='utf-8')
+
+    def wait_ready(self):
+        tail = []
+        for line in self.process.stdout:
+            if line.startswith(READY):
+                return int(line.split()[1])
+            tail = (tail + [line.rstrip()])[-20:]
+        raise RuntimeError("Render worker exited during startup:\n" + "\n".join(tail))
+
+    def drain(self):
+        log = open(self.log_path, 'a', encoding='utf-8') if self.log_path else None
+        for line in self.process.stdout:
+            if log:
+                log.write(line)
+                log.flush()
+        if log:
+            log.close()
+
+    def request(self, message):
+        self.stream.write(json.dumps(message) + "\n")
+        self.stream.flush()
+        reply = self.stream.readline()
+        if not reply:
+            raise RuntimeError(f"Render worker on port {self.port} closed the connection")
+        return json.loads(reply)
+
+    def render(self, job):
+        result = self.request(job)
+        self.spec = job['spec']
+        return result
+
+    def close(self):
+        try:
+            self.request({'type': 'shutdown'})
+        except (OSError, RuntimeError):
+            pass
+        self.stream.close()
+        self.connection.close()
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+    def kill(self):
+        """Drop a worker that stopped answering, without waiting on its socket"""
+        for closable in (self.stream, self.connection):
+            try:
+                closable.close()
+            except OSError:
+                pass
+        self.process.kill()
+        self.process.wait()
+
+
+class RenderPool:
+    def __init__(self, size=2, blender_path=None, log_dir=None, render_cache=None):
+        blender_path = blender_path or blender_binary()
+        if not blender_path:
+            raise RuntimeError("Blender not found; set $BLENDER or put blender on PATH")
+        self.size = size
+        self.blender_path = blender_path
+        self.log_dir = log_dir
+        self.render_cache = render_cache
+        self.blender_version = blender_version(blender_path) if render_cache else None
+        # Started on the first cache miss, so a fully cached job list never boots Blender
+        self.workers = None
+        self.idle = []
+        self.available = threading.Condition()
+        self.executor = ThreadPoolExecutor(size)
+
+    def start_workers(self):
+        print(f"🚀 [Pool] Starting {self.size} render workers...")
+        log_paths = [os.path.join(self.log_dir, f"worker_{i}.log") if self.log_dir else None for i in range(self.size)]
+
+        def start(log_path):
+            try:
+                return RenderWorkerClient(self.blender_path, log_path)
+            except (OSError, RuntimeError) as e:
+                print(f"❌ [Pool] Could not start a render worker: {e}")
+                return None
+
+        # Blender startup is the slow part, so the workers boot side by side
+        with ThreadPoolExecutor(self.size) as starter:
+            workers = [worker for worker in starter.map(start, log_paths) if worker is not None]
+        print(f"✅ [Pool] {len(workers)} workers ready on ports {', '.join(str(w.port) for w in workers)}")
+        return workers
+
+    def acquire(self, spec):
+        """Idle worker, preferring one that already holds this spec's scene"""
+        with self.available:
+            if self.workers is None:
+                self.workers = self.start_workers()
+                self.idle = list(self.workers)
+            while not self.idle:
+                if not self.workers:
+                    raise RuntimeError("No render workers left")
+                self.available.wait()
+            worker = next((w for w in self.idle if w.spec == spec), self.idle[0])
+            self.idle.remove(worker)
+            return worker
+
+    def release(self, worker):
+        with self.available:
+            self.idle.append(worker)
+            self.available.notify()
+
+    def replace(self, worker):
+        """Kill a dead worker and start another in its place; without a replacement the pool shrinks"""
+        exit_code = worker.process.poll()
+        worker.kill()
+        print(f"⚠️ [Pool] Worker on port {worker.port} failed (exit code {exit_code}); restarting it")
+        try:
+            replacement = RenderWorkerClient(worker.blender_path, worker.log_path)
+        except (OSError, RuntimeError) as e:
+            print(f"❌ [Pool] Could not restart the worker: {e}")
+            replacement = None
+        with self.available:
+            self.workers.remove(worker)
+            if replacement is not None:
+                self.workers.append(replacement)
+                self.idle.append(replacement)
+            # Waiters have to notice when the last worker is gone
+            self.available.notify_all()
+
+    def job_key(self, job):
+        """(render key, output, steering key). View jobs are keyed like sweep frames, on the LOD and settings
+        state resolved across the whole sweep; their key is None until a sweep or worker has recorded that state"""
+        spec = load_spec(job['spec'])
+        output = resolve_path(job['output']) if job.get('output') else spec_output(spec)
+        camera = job_camera(spec, job)
+        tier = job.get('tier', DEFAULT_TIER)
+        options = {'time_limit': job.get('time_limit')}
+        steering = None
+        if job.get('view') and not job.get('camera'):
+            context = context_cameras(spec, [find_view(spec, job['view'])])
+            steering = steering_key(spec, [camera] + context, tier, self.blender_version)
+            options['state'] = self.render_cache.fetch_state(steering)
+            if options['state'] is None:
+                return None, output, steering
+        return render_key(spec, camera, tier, self.blender_version, **options), output, steering
+
+    def run(self, job):
+        key = steering = None
+        if self.render_cache:
+            # Cached renders are copied out without touching a worker
+            key, output, steering = self.job_key(job)
+            # Without an output the worker rejects the job
+            if key and output and self.render_cache.fetch(key, output):
+                return {'id': job.get('id'), 'ok': True, 'output': output, 'cached': True,
+                        'timings': {'prepare': 0.0, 'render': 0.0, 'total': 0.0}}
+        try:
+            worker = self.acquire(job['spec'])
+        except RuntimeError as e:
+            return {'id': job.get('id'), 'ok': False, 'error': str(e)}
+        try:
+            result = worker.render(job)
+        except (OSError, RuntimeError, ValueError) as e:
+            # A crashed Blender fails only its own job; the manifest still records every other one
+            self.replace(worker)
+            return {'id': job.get('id'), 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        self.release(worker)
+        if self.render_cache and result.get('ok'):
+            if key is None and result.get('state') and steering:
+                # First render of this sweep's camera set: record its state so later lookups can key on it
+                self.render_cache.store_state(steering, result['state'])
+                key = self.job_key(job)[0]
+            if key:
+                self.render_cache.store(key, result['output'])
+        return result
+
+    def submit(self, job):
+        return self.executor.submit(self.run, job)
+
+    def map(self, jobs):
+        """Results in job order"""
+        return [future.result() for future in [self.submit(job) for job in jobs]]
+
+    def close(self):
+        self.executor.shutdown()
+        for worker in self.workers or ():
+            worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def option(args, name, default=None):
+    return args[args.index(name) + 1] if name in args[:-1] else default
+
+
+def sweep_jobs(spec_name, tier, output_dir):
+    """One job per view of a sweep spec, numbered like the frames of an animated sweep"""
+    spec = load_spec(spec_name)
+    pattern = os.path.join(output_dir, f"{spec_name}_####.png")
+    return [{'id': i, 'spec': spec_name, 'view': view['name'], 'tier': tier, 'output': frame_output(pattern, i + 1)}
+            for i, view in enumerate(spec.get('views', []))]
+
+
+def main():
+    args = sys.argv[1:]
+    spec_name = args[0] if args and not args[0].startswith('--') else "camera_test"
+    default_dir = os.path.join(SCRIPT_DIR, "references_and_renders", SWEEP_DIRS.get(spec_name, "renders"))
+    output_dir = option(args, '--output-dir', default_dir)
+    tier = option(args, '--tier', 'draft')
+    jobs = sweep_jobs(spec_name, tier, output_dir)
+
+    render_cache = None if '--no-render-cache' in args else RenderCache()
+    with RenderPool(int(option(args, '--workers', 2)), render_cache=render_cache) as pool:
+        results = pool.map(jobs)
+    if render_cache:
+        render_cache.report()
+    for result in results:
+        if result['ok']:
+            timings = result['timings']
+            source = "cached" if result.get('cached') else f"render {timings['render']:.1f}s"
+            print(f"   ✅ {os.path.basename(result['output'])}: {source}, total {timings['total']:.1f}s")
+        else:
+            print(f"   ❌ job {result['id']}: {result['error']}")
+    print(f"🎉 {sum(r['ok'] for r in results)}/{len(results)} jobs rendered")
+
+    # Same manifest as the animated sweeps, so the analysis scripts find views by name
+    spec = load_spec(spec_name)
+    shots = [(None, job['output'], job['id'] + 1) for job in jobs]
+    views = [find_view(spec, job['view']) for job in jobs]
+    timings = [{'path': job['output'], 'seconds': None if result.get('cached') else result['timings']['render'],
+                'cached': bool(result.get('cached'))} for job, result in zip(jobs, results) if result['ok']]
+    write_manifest(output_dir, spec, views, shots, timings, tier)
+
+
+if __name__ == "__main__":
+    main()
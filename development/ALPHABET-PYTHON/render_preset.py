@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Render Preset
+Runs a named scene spec end to end: clear, compile, render
+"""
+
+import sys
+import time
+
+import bpy
+
+from cycles_sampling import SampleMonitor, configure_sampling
+from progressive import frame_problem, pass_path, progressive_tiers, write_progress
+from quality_tiers import tier_arg
+from render_cache import RenderCache, render_key
+from scene_cache import SceneCache
+from scene_compiler import SceneCompiler
+from scene_reset import reset_scene
+from scene_spec import atomic_write, load_spec, spec_output
+
+
+def script_args(argv=None):
+    """Arguments after Blender's '--' separator"""
+    argv = sys.argv if argv is None else argv
+    return argv[argv.index('--') + 1:] if '--' in argv else []
+
+
+def script_option(name, default=None, argv=None):
+    """Value following '--name' in the script arguments"""
+    args = script_args(argv)
+    return args[args.index(name) + 1] if name in args[:-1] else default
+
+
+class RenderPreset:
+    spec_name = None
+
+    def __init__(self, spec=None, tier=None, time_budget=None):
+        self.spec = spec if spec is not None else load_spec(self.spec_name)
+        self.tier = tier
+        self.time_budget = time_budget
+        self.title = self.spec.get('title', self.spec['name'])
+        # Sweep specs have no output of their own; render workers serve them with one output per job
+        self.output_path = spec_output(self.spec)
+        self.compiler = SceneCompiler(self.spec, tier=tier, time_budget=time_budget)
+        self.scene_cache = SceneCache()
+        self.render_cache = RenderCache()
+
+    # ----------------------------------------
+    # SCENE SETUP
+    # ----------------------------------------
+    def clear_scene(self):
+        reset_scene()
+
+    def has_spec_objects(self):
+        return any("spec_digest" in obj for obj in bpy.context.scene.objects)
+
+    def build_scene(self, incremental=False, tune=True):
+        self.compiler.compile(incremental=incremental, tune=tune)
+
+    def prepare_scene(self, incremental=False, use_cache=True):
+        """Reuse the current scene, open a cached .blend, or build from scratch and cache it"""
+        if incremental and self.has_spec_objects():
+            self.build_scene(incremental=True)
+        elif use_cache and self.scene_cache.load(self.spec):
+            # Geometry is already there; only lights, camera and settings are synced
+            self.compiler = SceneCompiler(self.spec, tier=self.tier, time_budget=self.time_budget)
+            self.build_scene(incremental=True)
+        else:
+            self.clear_scene()
+            # The cache key has no time budget, so the .blend is saved with the untuned settings
+            self.build_scene(tune=not use_cache)
+            if use_cache:
+                self.scene_cache.save(self.spec)
+                if self.compiler.time_budget:
+                    self.compiler.tune_render_settings()
+                    self.compiler.fit_render_settings()
+
+    def update(self, spec):
+        """Switch to an edited spec and only touch what changed in the current scene"""
+        self.spec = spec
+        self.compiler.spec = spec
+        self.build_scene(incremental=True)
+
+    # ----------------------------------------
+    # RENDER
+    # ----------------------------------------
+    def render(self, time_limit=None, output_path=None):
+        output_path = output_path or self.output_path
+        scene = bpy.context.scene
+        cycles = scene.render.engine == 'CYCLES'
+        if cycles:
+            configure_sampling(scene, time_limit)
+        print("🎨 [Render] Rendering...")
+        scene.render.filepath = output_path
+        start = time.perf_counter()
+        with SampleMonitor() as monitor:
+            bpy.ops.render.render(write_still=True)
+        elapsed = time.perf_counter() - start
+        if cycles:
+            monitor.report(elapsed)
+        print(f"✅ Render saved to {output_path} ({elapsed:.1f}s)")
+        return elapsed
+
+    def render_progressive(self, time_limit=None, abort_broken=True):
+        """Render each cheaper tier before the target one; stop early when a pass comes out broken"""
+        tiers = progressive_tiers(self.tier)
+        progress = {'tier': self.tier, 'passes': len(tiers), 'pass': 0, 'path': None, 'done': False}
+        for index, tier in enumerate(tiers, 1):
+            final = index == len(tiers)
+            print(f"🔁 [Progressive] Pass {index}/{len(tiers)}: {tier}")
+            self.compiler.tier = tier
+            self.compiler.setup_render_settings(fit=False)
+            if final and self.compiler.time_budget:
+                # setup_render_settings restores the tier's samples; fit the budget again for the final pass
+                self.compiler.tune_render_settings()
+            self.compiler.fit_render_settings()
+            path = self.output_path if final else pass_path(self.output_path, index)
+            # Render beside the target and rename, so readers only ever see whole images
+            with atomic_write(path) as temp_path:
+                self.render(time_limit if final else None, output_path=temp_path)
+
+            problem = frame_problem(path)
+            progress.update({'pass': index, 'path': path, 'pass_tier': tier, 'problem': problem, 'done': final})
+            write_progress(self.output_path, progress)
+            if problem and abort_broken and not final:
+                print(f"❌ [Progressive] Pass {index} is {problem}; skipping the remaining passes")
+                return False
+        self.compiler.tier = self.tier
+        return True
+
+    # ----------------------------------------
+    # MAIN RUNNER
+    # ----------------------------------------
+    def run(self, incremental=None, use_cache=None, tier=None, time_limit=None, time_budget=None,
+            use_render_cache=None):
+        args = script_args()
+        if incremental is None:
+            incremental = '--incremental' in args
+        if use_cache is None:
+            use_cache = '--no-scene-cache' not in args
+        if use_render_cache is None:
+            use_render_cache = '--no-render-cache' not in args
+        self.tier = self.compiler.tier = tier or tier_arg(args)
+        if time_limit is None and script_option('--time-limit'):
+            time_limit = float(script_option('--time-limit'))
+        if time_budget is None and script_option('--time-budget'):
+            time_budget = float(script_option('--time-budget'))
+        self.time_budget = self.compiler.time_budget = time_budget
+        print(f"🚀 Starting {self.title} [{self.tier}]...")
+        print("=" * 50)
+
+        # An identical earlier render skips the scene build entirely
+        key = render_key(self.spec, self.spec.get('camera'), self.tier, bpy.app.version_string,
+                         time_limit=time_limit, time_budget=time_budget)
+        if use_render_cache and self.render_cache.fetch(key, self.output_path):
+            rendered = True
+        else:
+            self.prepare_scene(incremental=incremental, use_cache=use_cache)
+            if '--progressive' in args:
+                rendered = self.render_progressive(time_limit=time_limit, abort_broken='--keep-broken' not in args)
+            else:
+                self.render(time_limit=time_limit)
+                rendered = True
+            if use_render_cache and rendered:
+                self.render_cache.store(key, self.output_path)
+        if use_render_cache:
+            self.render_cache.report()
+
+        print("=" * 50)
+        print(f"🎉 {self.title} Complete!")
+        print("=" * 50)
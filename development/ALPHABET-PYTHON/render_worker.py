@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Render Worker
+Long-lived headless Blender that renders JSON jobs received over a local socket
+
+    blender --background --python render_worker.py -- --port 0
+
+Job:    {"id": 1, "spec": "camera_test", "view": "front", "tier": "draft", "output": "path.png"}
+        "camera" (a camera section) may replace "view"; without either the spec's own camera is used.
+Reply:  {"id": 1, "ok": true, "output": "...", "timings": {"prepare": 0.1, "render": 2.3, "total": 2.4}}
+        View jobs also reply with "state", the LOD and settings digest their render cache keys are built on.
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+import traceback
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from camera_batch import resolved_state, sweep_cameras
+from lod import apply_lod
+from quality_tiers import DEFAULT_TIER
+from render_preset import RenderPreset, script_option
+from scene_spec import context_cameras, find_view, job_camera, load_spec, resolve_path, spec_output
+
+# First stdout line the client waits for, followed by the listening port
+READY = "RENDER_WORKER_READY"
+
+
+class RenderWorker:
+    def __init__(self):
+        self.preset = None
+        self.jobs = 0
+
+    # ----------------------------------------
+    # SCENE
+    # ----------------------------------------
+    def prepare(self, spec, tier):
+        """Keep the built scene between jobs: a new spec rebuilds, an edited one syncs, a new tier re-applies settings"""
+        if self.preset is None or self.preset.spec['name'] != spec['name']:
+            self.preset = RenderPreset(spec, tier=tier)
+            self.preset.prepare_scene()
+            return
+        tier_changed = tier != self.preset.tier
+        self.preset.tier = self.preset.compiler.tier = tier
+        if spec != self.preset.spec:
+            self.preset.update(spec)
+        elif tier_changed:
+            self.preset.compiler.setup_render_settings()
+
+    # ----------------------------------------
+    # JOBS
+    # ----------------------------------------
+    def run_job(self, job):
+        start = time.perf_counter()
+        spec = load_spec(job['spec'])
+        own_camera = not (job.get('camera') or job.get('view'))
+        if own_camera and not spec.get('camera'):
+            # Sweep specs only have views; fail before building the scene
+            raise ValueError(f"Spec '{spec['name']}' has no camera section; give the job a 'view' or 'camera'")
+        output = resolve_path(job['output']) if job.get('output') else spec_output(spec)
+        if output is None:
+            raise ValueError(f"Spec '{spec['name']}' has no output; give the job an 'output'")
+        self.prepare(spec, job.get('tier', DEFAULT_TIER))
+        compiler = self.preset.compiler
+        scene = bpy.context.scene
+
+        camera = state = None
+        try:
+            if own_camera:
+                scene.camera = bpy.data.objects.get(spec['camera'].get('name', 'Camera'))
+                if scene.camera is None:
+                    raise ValueError(f"Camera '{spec['camera'].get('name', 'Camera')}' is not in the scene")
+                # Meshes still carry the LOD picked for the previous job's camera
+                if spec.get('lod', True):
+                    apply_lod(compiler.builder, cameras=[scene.camera])
+            elif job.get('view'):
+                # LOD and settings fit across every view of the sweep, as the sweep scripts do, so the frame
+                # and its cache key match theirs
+                camera_spec = job_camera(spec, job)
+                context = context_cameras(spec, [find_view(spec, job['view'])])
+                camera = sweep_cameras(compiler, [(camera_spec,)], context)[0]
+                scene.camera = camera
+                state = resolved_state(scene)
+            else:
+                camera = compiler.setup_camera(job_camera(spec, job))
+            if state is None:
+                compiler.fit_render_settings()
+            prepared = time.perf_counter()
+
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+            # The scene keeps whatever limit the previous job set, so always pass one; 0 renders without a limit
+            time_limit = job.get('time_limit')
+            if time_limit is None:
+                time_limit = spec.get('render', {}).get('cycles', {}).get('time_limit', 0)
+            render_time = self.preset.render(time_limit=time_limit, output_path=output)
+        finally:
+            if camera is not None:
+                compiler.builder.remove_object(camera)
+
+        self.jobs += 1
+        return {'id': job.get('id'), 'ok': True, 'output': output, 'jobs': self.jobs, 'state': state,
+                'timings': {'prepare': prepared - start, 'render': render_time,
+                            'total': time.perf_counter() - start}}
+
+    def handle(self, job):
+        try:
+            return self.run_job(job)
+        except Exception as e:
+            traceback.print_exc()
+            return {'id': job.get('id'), 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+
+
+def serve(port=0):
+    """Answer one JSON job per line from a single client; exit on a {"type": "shutdown"} job or when it disconnects"""
+    worker = RenderWorker()
+    server = socket.create_server(("127.0.0.1", port))
+    print(f"{READY} {server.getsockname()[1]}", flush=True)
+    # Only the pool that started this worker connects; once it is gone nobody else will shut the worker down
+    connection, _ = server.accept()
+    server.close()
+    try:
+        with connection, connection.makefile('rw', encoding='utf-8') as stream:
+            for line in stream:
+                job = json.loads(line)
+                if job.get('type') == 'shutdown':
+                    stream.write(json.dumps({'ok': True, 'jobs': worker.jobs}) + "\n")
+                    stream.flush()
+                    return
+                stream.write(json.dumps(worker.handle(job)) + "\n")
+                stream.flush()
+    except ConnectionError:
+        # The client died while a job was rendering
+        pass
+    print(f"🔌 [Worker] Client disconnected after {worker.jobs} jobs; exiting")
+
+
+if __name__ == "__main__":
+    serve(int(script_option('--port', 0)))
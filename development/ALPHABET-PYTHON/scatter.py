@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Scatter
+Seeded vegetation and rock scattering drawn as instances of shared prototype collections
+"""
+
+import math
+import random
+
+import bpy
+
+from scene_spec import item_digest
+
+# Point instancing reads the scatter attributes through the Named Attribute node, added in Blender 3.2;
+# older versions fall back to collection instances
+GEOMETRY_NODES = bpy.app.version >= (3, 2, 0)
+
+
+def scatter_points(layer):
+    """Deterministic (location, rotation, scale, prototype index) samples for one layer spec"""
+    rng = random.Random(layer.get('seed', 0))
+    cx, cy = layer['area']['center']
+    sx, sy = layer['area']['size']
+    z = layer.get('z', 0.0)
+    smin, smax = layer.get('scale', (1.0, 1.0))
+    tilt = math.radians(layer.get('tilt', 0.0))
+    excludes = layer.get('exclude', [])
+    weights = layer.get('weights')
+    choices = range(len(layer['prototypes']))
+
+    points = []
+    attempts = 0
+    # Rejection sampling around exclusion zones, bounded so a crowded layer cannot spin forever
+    while len(points) < layer['count'] and attempts < layer['count'] * 20:
+        attempts += 1
+        x = cx + (rng.random() - 0.5) * sx
+        y = cy + (rng.random() - 0.5) * sy
+        if any((x - e['center'][0]) ** 2 + (y - e['center'][1]) ** 2 < e['radius'] ** 2 for e in excludes):
+            continue
+        s = rng.uniform(smin, smax)
+        rotation = (rng.uniform(-tilt, tilt), rng.uniform(-tilt, tilt), rng.uniform(0.0, 2 * math.pi))
+        index = rng.choices(choices, weights)[0] if weights else rng.randrange(len(choices))
+        points.append(((x, y, z), rotation, (s, s, s), index))
+    return points
+
+
+def enabled_output(node):
+    """First visible output; Named Attribute keeps one hidden output per data type in Blender 3.x"""
+    return next((socket for socket in node.outputs if socket.enabled), node.outputs[0])
+
+
+def new_interface_socket(tree, name, in_out, socket_type):
+    if hasattr(tree, 'interface'):
+        tree.interface.new_socket(name=name, in_out=in_out, socket_type=socket_type)
+    else:
+        (tree.inputs if in_out == 'INPUT' else tree.outputs).new(socket_type, name)
+
+
+class Scatterer:
+    def __init__(self, compiler):
+        self.compiler = compiler
+        self.builder = compiler.builder
+        self.prototypes = {}
+
+    # ----------------------------------------
+    # PROTOTYPES
+    # ----------------------------------------
+    def prototype_digest(self, name):
+        parts = self.compiler.spec['scatter']['prototypes'][name]
+        return item_digest(parts, [self.compiler.material_spec(part.get('material')) for part in parts])
+
+    def build_prototype(self, name):
+        """Template collection for one prototype, built once from pooled primitives at the origin"""
+        if name in self.prototypes:
+            return self.prototypes[name]
+
+        digest = self.prototype_digest(name)
+        existing = bpy.data.collections.get(f"Proto_{name}")
+        if existing is not None and self.compiler.incremental:
+            if existing.get("spec_digest") == digest:
+                self.prototypes[name] = existing
+                return existing
+            self.builder.remove_collection(existing)
+
+        template = self.builder.template_builder(f"Proto_{name}")
+        template.collection["spec_digest"] = digest
+        for i, part in enumerate(self.compiler.spec['scatter']['prototypes'][name]):
+            template.add_pooled_primitive(
+                part['primitive'], part.get('offset', (0, 0, 0)), scale=part.get('scale', (1, 1, 1)),
+                rotation=tuple(math.radians(a) for a in part.get('rotation', (0, 0, 0))),
+                material=self.compiler.materials.get(part.get('material')), name=f"Proto_{name}_{i}",
+                segments=part.get('segments', 12))
+        self.prototypes[name] = template.collection
+        return template.collection
+
+    def layer_prototypes(self, layer):
+        """Parent collection whose children are the layer's prototypes, in index order"""
+        name = f"Scatter_{layer['name']}_Prototypes"
+        stale = bpy.data.collections.get(name)
+        if stale is not None:
+            # Left by the layer's previous build; only the parent goes, the prototypes it holds are shared
+            bpy.data.collections.remove(stale)
+        parent = bpy.data.collections.new(name)
+        for name in layer['prototypes']:
+            parent.children.link(self.build_prototype(name))
+        return parent
+
+    # ----------------------------------------
+    # GEOMETRY NODES INSTANCING
+    # ----------------------------------------
+    def point_cloud(self, name, points):
+        """Vertex-only mesh carrying per-point prototype index, rotation and scale attributes"""
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(points))
+        mesh.vertices.foreach_set("co", [c for loc, _, _, _ in points for c in loc])
+        for attr, data_type, key, values in (
+            ("proto_index", 'INT', "value", [index for _, _, _, index in points]),
+            ("proto_rotation", 'FLOAT_VECTOR', "vector", [c for _, rot, _, _ in points for c in rot]),
+            ("proto_scale", 'FLOAT_VECTOR', "vector", [c for _, _, scale, _ in points for c in scale]),
+        ):
+            mesh.attributes.new(attr, data_type, 'POINT').data.foreach_set(key, values)
+        mesh.update()
+        return mesh
+
+    def instancing_node_group(self, name, prototypes):
+        tree = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+        new_interface_socket(tree, "Geometry", 'INPUT', 'NodeSocketGeometry')
+        new_interface_socket(tree, "Geometry", 'OUTPUT', 'NodeSocketGeometry')
+        nodes = tree.nodes
+        links = tree.links
+
+        group_in = nodes.new('NodeGroupInput')
+        group_out = nodes.new('NodeGroupOutput')
+
+        collection_info = nodes.new('GeometryNodeCollectionInfo')
+        collection_info.transform_space = 'ORIGINAL'
+        collection_info.inputs['Collection'].default_value = prototypes
+        collection_info.inputs['Separate Children'].default_value = True
+        collection_info.inputs['Reset Children'].default_value = True
+
+        instance = nodes.new('GeometryNodeInstanceOnPoints')
+        instance.inputs['Pick Instance'].default_value = True
+
+        def named_attribute(attr, data_type):
+            node = nodes.new('GeometryNodeInputNamedAttribute')
+            node.data_type = data_type
+            node.inputs['Name'].default_value = attr
+            return enabled_output(node)
+
+        links.new(group_in.outputs[0], instance.inputs['Points'])
+        links.new(collection_info.outputs[0], instance.inputs['Instance'])
+        links.new(named_attribute("proto_index", 'INT'), instance.inputs['Instance Index'])
+        links.new(named_attribute("proto_rotation", 'FLOAT_VECTOR'), instance.inputs['Rotation'])
+        links.new(named_attribute("proto_scale", 'FLOAT_VECTOR'), instance.inputs['Scale'])
+        # Instances stay unrealized so memory does not grow with density
+        links.new(instance.outputs['Instances'], group_out.inputs[0])
+        return tree
+
+    def add_instancer(self, layer, points):
+        name = f"Scatter_{layer['name']}"
+        mesh = self.point_cloud(name, points)
+        obj = self.builder.add_object(name, mesh)
+        modifier = obj.modifiers.new("Scatter", 'NODES')
+        modifier.node_group = self.instancing_node_group(name, self.layer_prototypes(layer))
+        return obj
+
+    # ----------------------------------------
+    # COLLECTION INSTANCE FALLBACK
+    # ----------------------------------------
+    def add_collection_instances(self, layer, points):
+        """One instancing empty per point, grouped in a collection linked under the scene"""
+        layer_builder = self.builder.template_builder(f"Scatter_{layer['name']}")
+        self.builder.collection.children.link(layer_builder.collection)
+        for i, (loc, rot, scale, index) in enumerate(points):
+            layer_builder.add_collection_instance(f"Scatter_{layer['name']}_{i:05d}",
+                                                  self.build_prototype(layer['prototypes'][index]),
+                                                  loc, rot, scale)
+        return layer_builder.collection
+
+    # ----------------------------------------
+    # LAYERS
+    # ----------------------------------------
+    def layer_digest(self, layer):
+        return item_digest(layer, [self.prototype_digest(name) for name in layer['prototypes']], GEOMETRY_NODES)
+
+    def build_layer(self, layer):
+        points = scatter_points(layer)
+        digest = self.layer_digest(layer)
+        if GEOMETRY_NODES:
+            self.compiler.sync(f"Scatter_{layer['name']}", digest, lambda: self.add_instancer(layer, points),
+                               lambda obj: False)
+        else:
+            self.compiler.sync_collection(f"Scatter_{layer['name']}", digest,
+                                          lambda: self.add_collection_instances(layer, points))
+        print(f"   {layer['name']}: {len(points)} instances of {', '.join(layer['prototypes'])}")
+        return len(points)
+
+    def build(self):
+        total = sum(self.build_layer(layer) for layer in self.compiler.spec['scatter'].get('layers', []))
+        method = "geometry nodes" if GEOMETRY_NODES else "collection instances"
+        print(f"✅ Scattered {total} instances from {len(self.prototypes)} prototypes ({method}).")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Scene Builder
+Operator-free object construction through bpy.data and bmesh
+"""
+
+import bmesh
+import bpy
+
+
+def id_alive(id_block):
+    """False once the datablock has been removed from bpy.data"""
+    try:
+        id_block.name
+        return True
+    except ReferenceError:
+        return False
+
+
+class SceneBuilder:
+    def __init__(self, collection=None, mesh_pool=None):
+        self.collection = collection if collection is not None else bpy.context.scene.collection
+        self.mesh_pool = mesh_pool if mesh_pool is not None else {}
+
+    # ----------------------------------------
+    # GEOMETRY
+    # ----------------------------------------
+    def create_mesh(self, type, name, size=2.0, radius=1.0, depth=2.0, segments=32, rings=16):
+        """Build primitive geometry with bmesh, matching the bpy.ops defaults"""
+        bm = bmesh.new()
+        if type == 'plane':
+            bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=size / 2)
+        elif type == 'cube':
+            bmesh.ops.create_cube(bm, size=size)
+        elif type == 'cylinder':
+            bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=segments,
+                                  radius1=radius, radius2=radius, depth=depth)
+        elif type == 'sphere':
+            bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=rings, radius=radius)
+        else:
+            bm.free()
+            raise ValueError(f"Unknown primitive type: {type}")
+
+        mesh = bpy.data.meshes.new(name)
+        bm.to_mesh(mesh)
+        bm.free()
+        return mesh
+
+    def pooled_mesh(self, type, segments=32):
+        """Shared unit mesh per primitive type and segment count"""
+        if type in ('plane', 'cube'):
+            segments = 0
+        key = (type, segments)
+        mesh = self.mesh_pool.get(key)
+        if mesh is None or not id_alive(mesh):
+            name = f"Pool_{type}_{segments}" if segments else f"Pool_{type}"
+            # Pooled meshes come back with scenes opened from the .blend cache
+            mesh = bpy.data.meshes.get(name)
+            if mesh is None:
+                dims = {'segments': segments, 'rings': max(segments // 2, 3)} if segments else {}
+                mesh = self.create_mesh(type, name, **dims)
+                # Empty slot so each object can carry its own material without touching the shared data
+                mesh.materials.append(None)
+            self.mesh_pool[key] = mesh
+        return mesh
+
+    # ----------------------------------------
+    # OBJECTS
+    # ----------------------------------------
+    def add_object(self, name, data, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1), material=None):
+        """Create an object for existing data and link it straight into the collection"""
+        obj = bpy.data.objects.new(name, data)
+        obj.location = location
+        obj.rotation_euler = rotation
+        obj.scale = scale
+        if material and data is not None:
+            data.materials.append(material)
+        self.collection.objects.link(obj)
+        return obj
+
+    def add_primitive(self, type, location, scale=(1, 1, 1), rotation=(0, 0, 0), material=None, name=None, **dims):
+        """Data-API replacement for bpy.ops.mesh.primitive_*_add"""
+        name = name or type.capitalize()
+        mesh = self.create_mesh(type, name, **dims)
+        return self.add_object(name, mesh, location, rotation, scale, material)
+
+    def add_pooled_primitive(self, type, location, scale=(1, 1, 1), rotation=(0, 0, 0), material=None, name=None,
+                             segments=32):
+        """Linked duplicate of a pooled primitive; only the object transform is unique"""
+        mesh = self.pooled_mesh(type, segments)
+        obj = self.add_shared_object(name or type.capitalize(), mesh, location, rotation, scale, material)
+        obj["primitive"] = type
+        obj["segments"] = segments if type in ('cylinder', 'sphere') else 0
+        return obj
+
+    def add_shared_object(self, name, data, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1), material=None):
+        """Object on reusable data (pool or cache) with its material kept on the object"""
+        obj = self.add_object(name, data, location, rotation, scale)
+        if material:
+            self.set_object_material(obj, material)
+        return obj
+
+    def set_object_material(self, obj, material):
+        """Assign a material on the object's first slot, leaving shared mesh data untouched"""
+        slot = obj.material_slots[0]
+        slot.link = 'OBJECT'
+        slot.material = material
+
+    def add_text(self, name, body, location, size=1.0, extrude=0.0, bevel_depth=0.0, bevel_resolution=None,
+                 font=None, material=None):
+        """Data-API replacement for bpy.ops.object.text_add"""
+        curve = bpy.data.curves.new(name, type='FONT')
+        curve.body = body
+        curve.size = size
+        curve.extrude = extrude
+        curve.bevel_depth = bevel_depth
+        if bevel_resolution is not None:
+            curve.bevel_resolution = bevel_resolution
+        if font:
+            curve.font = font
+        return self.add_object(name, curve, location, material=material)
+
+    def add_light(self, name, type, location, rotation=(0, 0, 0)):
+        """Data-API replacement for bpy.ops.object.light_add"""
+        return self.add_object(name, bpy.data.lights.new(name, type=type), location, rotation)
+
+    def add_camera(self, name, location, rotation=(0, 0, 0)):
+        """Data-API replacement for bpy.ops.object.camera_add"""
+        return self.add_object(name, bpy.data.cameras.new(name), location, rotation)
+
+    def remove_object(self, obj):
+        """Remove an object along with any data and node groups it leaves without users"""
+        data = obj.data
+        node_groups = [m.node_group for m in obj.modifiers if m.type == 'NODES' and m.node_group]
+        bpy.data.objects.remove(obj, do_unlink=True)
+        for group in node_groups:
+            if not group.users:
+                bpy.data.node_groups.remove(group)
+        if data is None or data.users:
+            return
+        # Pool and letter caches notice removed meshes through id_alive and rebuild on demand
+        if isinstance(data, bpy.types.Light):
+            bpy.data.lights.remove(data)
+        elif isinstance(data, bpy.types.Camera):
+            bpy.data.cameras.remove(data)
+        elif isinstance(data, bpy.types.Mesh):
+            bpy.data.meshes.remove(data)
+
+    # ----------------------------------------
+    # TEMPLATES AND INSTANCES
+    # ----------------------------------------
+    def template_builder(self, name):
+        """Builder for a template collection that is kept out of the view layer"""
+        return SceneBuilder(bpy.data.collections.new(name), self.mesh_pool)
+
+    def add_collection_instance(self, name, collection, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
+        """Place a collection as an instancing empty instead of copying its objects"""
+        obj = self.add_object(name, None, location, rotation, scale)
+        obj.instance_type = 'COLLECTION'
+        obj.instance_collection = collection
+        return obj
+
+    def remove_collection(self, collection):
+        for obj in list(collection.objects):
+            self.remove_object(obj)
+        bpy.data.collections.remove(collection)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Scene Cache
+Saves built scenes as .blend files keyed by scene content, builder code and Blender version
+"""
+
+import hashlib
+import os
+
+import bpy
+
+from scene_spec import BUILDER_MODULES, SCRIPT_DIR, atomic_write, source_digest, spec_hash
+
+CACHE_DIR = os.path.join(SCRIPT_DIR, "cache", "scenes")
+
+# Geometry-bearing sections; render settings, world, lights and camera are re-synced after opening
+SCENE_SECTIONS = ('materials', 'environment', 'scatter', 'characters')
+
+
+class SceneCache:
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.stats = {'hits': 0, 'misses': 0}
+        self._builder_version = None
+
+    # ----------------------------------------
+    # KEYS
+    # ----------------------------------------
+    def builder_version(self):
+        """Digest of the builder sources, read once per session"""
+        if self._builder_version is None:
+            self._builder_version = source_digest(BUILDER_MODULES)
+        return self._builder_version
+
+    def key(self, spec):
+        # The lod flag decides whether pooled meshes are swapped for lighter levels before saving
+        parts = (spec_hash(spec, sections=SCENE_SECTIONS), f"lod={spec.get('lod', True)}", self.builder_version(),
+                 bpy.app.version_string)
+        return hashlib.sha256("|".join(parts).encode('utf-8')).hexdigest()[:24]
+
+    def path(self, spec):
+        return os.path.join(self.cache_dir, f"{spec.get('name', 'scene')}_{self.key(spec)}.blend")
+
+    # ----------------------------------------
+    # LOAD AND SAVE
+    # ----------------------------------------
+    def load(self, spec):
+        """Open the cached scene for this spec; False when it has to be built"""
+        path = self.path(spec)
+        if not os.path.exists(path):
+            self.stats['misses'] += 1
+            return False
+        try:
+            bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+        except Exception as e:
+            print(f"⚠️ Could not open cached scene '{path}': {e}")
+            self.stats['misses'] += 1
+            return False
+        self.stats['hits'] += 1
+        print(f"📦 [Scene Cache] Opened {os.path.basename(path)}")
+        return True
+
+    def save(self, spec):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(spec)
+        # Parallel Blender processes never open half a file
+        try:
+            with atomic_write(path) as temp_path:
+                bpy.ops.wm.save_as_mainfile(filepath=temp_path, copy=True, check_existing=False)
+            print(f"📦 [Scene Cache] Saved {os.path.basename(path)}")
+        except Exception as e:
+            print(f"⚠️ Could not cache scene '{path}': {e}")
+
+    def report(self):
+        print(f"📦 [Scene Cache] {self.stats['hits']} opened, {self.stats['misses']} built")
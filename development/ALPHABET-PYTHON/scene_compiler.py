@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Scene Compiler
+Turns a declarative scene spec (see scene_specs/) into bpy data through one builder
+"""
+
+import math
+import os
+
+import bpy
+
+from autotune import autotune
+from eevee_quality import fit_eevee_settings
+from letter_cache import shared_letter_cache
+from lod import apply_lod
+from material_registry import shared_registry
+from quality_tiers import tier_settings
+from scatter import Scatterer
+from scene_builder import SceneBuilder
+from scene_spec import item_digest
+
+FONT_DIR = "C:\\Windows\\Fonts"
+FONT_FILES = {
+    'Impact': 'impact.ttf',
+    'Arial': 'arial.ttf',
+    'Verdana': 'verdana.ttf',
+    # Extend as needed
+}
+
+
+def radians(rotation):
+    """Specs store rotations in degrees"""
+    return tuple(math.radians(a) for a in rotation)
+
+
+def apply_settings(target, settings, label="Render"):
+    """Set bpy properties from a dict that mirrors their attribute paths"""
+    for key, value in settings.items():
+        if isinstance(value, dict):
+            apply_settings(getattr(target, key), value, label)
+            continue
+        try:
+            setattr(target, key, value)
+        except (AttributeError, TypeError) as e:
+            # Property renamed or removed in this Blender version
+            print(f"⚠️ [{label}] Skipping '{key}': {e}")
+
+
+class SceneCompiler:
+    def __init__(self, spec, builder=None, tier=None, time_budget=None):
+        self.spec = spec
+        self.tier = tier
+        self.time_budget = time_budget
+        self.builder = builder if builder is not None else SceneBuilder()
+        self.material_registry = shared_registry()
+        self.letter_cache = shared_letter_cache()
+        self.materials = {}
+        self.character_rig = None
+        self.incremental = False
+        self.managed = set()
+        self.stats = {}
+
+    def compile(self, incremental=False, tune=True):
+        """Build the scene described by the spec; incremental keeps objects whose spec entry is unchanged.
+        tune=False leaves the time budget to the caller, e.g. until the untuned scene has been cached"""
+        print(f"🏗️ [Compile] {self.spec.get('title', self.spec.get('name', 'Scene'))}...")
+        self.incremental = incremental
+        self.managed = set()
+        self.stats = {'kept': 0, 'edited': 0, 'added': 0, 'removed': 0}
+        self.character_rig = None
+
+        # EEVEE effects are fitted once the scene extent and camera are known
+        self.setup_render_settings(fit=False)
+        self.setup_world()
+        self.setup_materials()
+        self.setup_lighting()
+        self.build_environment()
+        self.build_scatter()
+        self.create_characters()
+        if 'camera' in self.spec:
+            self.setup_camera()
+        if self.time_budget and tune:
+            self.tune_render_settings()
+        self.fit_render_settings()
+
+        if incremental:
+            self.remove_stale_objects()
+            print(f"♻️ [Incremental] {self.stats['kept']} kept, {self.stats['edited']} edited, "
+                  f"{self.stats['added']} added, {self.stats['removed']} removed")
+        print("✅ Scene compiled.")
+
+    # ----------------------------------------
+    # INCREMENTAL SYNC
+    # ----------------------------------------
+    def sync(self, name, digest, create, update):
+        """Keep, edit or create the object named by the spec, stamped with its entry digest"""
+        self.managed.add(name)
+        obj = bpy.data.objects.get(name) if self.incremental else None
+        if obj is not None and obj.get("spec_digest") == digest:
+            self.stats['kept'] += 1
+            return obj
+        if obj is not None and update(obj):
+            self.stats['edited'] += 1
+        else:
+            if obj is not None:
+                self.builder.remove_object(obj)
+            obj = create()
+            self.stats['added'] += 1
+        obj["spec_digest"] = digest
+        return obj
+
+    def sync_collection(self, name, digest, create):
+        """Keep or rebuild a spec-built child collection as one unit"""
+        self.managed.add(name)
+        collection = bpy.data.collections.get(name) if self.incremental else None
+        if collection is not None and collection.get("spec_digest") == digest:
+            self.stats['kept'] += 1
+            return collection
+        if collection is not None:
+            self.builder.remove_collection(collection)
+        collection = create()
+        self.stats['added'] += 1
+        collection["spec_digest"] = digest
+        return collection
+
+    def remove_stale_objects(self):
+        """Drop spec-built objects and collections that are no longer in the spec"""
+        for obj in list(self.builder.collection.objects):
+            if "spec_digest" in obj and obj.name not in self.managed:
+                self.builder.remove_object(obj)
+                self.stats['removed'] += 1
+        for collection in list(self.builder.collection.children):
+            if "spec_digest" in collection and collection.name not in self.managed:
+                self.builder.remove_collection(collection)
+                self.stats['removed'] += 1
+
+    def material_spec(self, key):
+        return self.spec.get('materials', {}).get(key)
+
+    def set_transform(self, obj, location, rotation=(0, 0, 0), scale=(1, 1, 1)):
+        obj.location = location
+        obj.rotation_euler = rotation
+        obj.scale = scale
+
+    # ----------------------------------------
+    # RENDER SETTINGS AND WORLD
+    # ----------------------------------------
+    def setup_render_settings(self, fit=True):
+        print("⚙️ [Render] Configuring...")
+        # Autotune lowers the percentage and tiers without overrides never set it; start every compile at full size
+        bpy.context.scene.render.resolution_percentage = 100
+        apply_settings(bpy.context.scene, self.spec.get('render', {}))
+        if self.tier:
+            apply_settings(bpy.context.scene, tier_settings(self.tier, self.spec.get('render', {})))
+            render = bpy.context.scene.render
+            print(f"   Quality tier: {self.tier} ({render.resolution_x}x{render.resolution_y})")
+        if fit:
+            self.fit_render_settings()
+        print("✅ Render settings applied.")
+
+    def fit_render_settings(self, cameras=None):
+        """Shadow maps, GTAO and bloom sized to the output resolution; "fit_eevee": false keeps the spec's"""
+        if self.spec.get('fit_eevee', True):
+            fit_eevee_settings(cameras=cameras, render_spec=self.spec.get('render', {}))
+
+    def tune_render_settings(self):
+        """Fit samples and resolution to the time budget; needs the built scene and its camera"""
+        scene = bpy.context.scene
+        if scene.camera is None:
+            print("⚠️ [Autotune] No scene camera, keeping the tier settings")
+            return
+        percentage = scene.render.resolution_percentage
+        autotune(scene, self.spec, self.time_budget)
+        if scene.render.resolution_percentage != percentage and self.spec.get('lod', True):
+            apply_lod(self.builder)
+
+    def setup_world(self):
+        world_spec = self.spec.get('world')
+        if not world_spec:
+            return
+        world = bpy.context.scene.world
+        if 'sky' in world_spec:
+            world.use_nodes = True
+            world_nodes = world.node_tree.nodes
+            world_links = world.node_tree.links
+            world_nodes.clear()
+
+            sky_texture = world_nodes.new('ShaderNodeTexSky')
+            apply_settings(sky_texture, world_spec['sky'], "World")
+            background = world_nodes.new('ShaderNodeBackground')
+            output = world_nodes.new('ShaderNodeOutputWorld')
+
+            world_links.new(sky_texture.outputs['Color'], background.inputs['Color'])
+            world_links.new(background.outputs['Background'], output.inputs['Surface'])
+        else:
+            world.use_nodes = False
+            world.color = world_spec['color']
+        print("🌍 Background set.")
+
+    # ----------------------------------------
+    # MATERIALS
+    # ----------------------------------------
+    def create_material(self, material_spec):
+        params = dict(material_spec)
+        kind = params.pop('kind')
+        name = params.pop('name')
+        builders = {
+            'flat': self.material_registry.flat,
+            'pbr': self.material_registry.pbr,
+            'water': self.material_registry.water,
+        }
+        if kind not in builders:
+            raise ValueError(f"Unknown material kind: {kind}")
+        return builders[kind](name, **params)
+
+    def setup_materials(self):
+        print("🎨 [Materials] Creating...")
+        self.materials = {key: self.create_material(material_spec)
+                          for key, material_spec in self.spec.get('materials', {}).items()}
+        self.material_registry.report()
+        print("✅ Materials created.")
+
+    # ----------------------------------------
+    # LIGHTING AND CAMERA
+    # ----------------------------------------
+    def add_light(self, light_spec):
+        settings = {k: v for k, v in light_spec.items() if k not in ('name', 'type', 'location', 'rotation')}
+        if 'spot_size' in settings:
+            settings['spot_size'] = math.radians(settings['spot_size'])
+        rotation = radians(light_spec.get('rotation', (0, 0, 0)))
+
+        def create():
+            light = self.builder.add_light(light_spec['name'], light_spec['type'], light_spec['location'], rotation)
+            apply_settings(light.data, settings, "Lighting")
+            return light
+
+        def update(light):
+            if light.type != 'LIGHT':
+                return False
+            self.set_transform(light, light_spec['location'], rotation)
+            light.data.type = light_spec['type']
+            apply_settings(light.data, settings, "Lighting")
+            return True
+
+        return self.sync(light_spec['name'], item_digest(light_spec), create, update)
+
+    def setup_lighting(self):
+        print("💡 [Lighting] Setting up...")
+        for light_spec in self.spec.get('lights', []):
+            self.add_light(light_spec)
+        print("✅ Lighting configured.")
+
+    def setup_camera(self, camera_spec=None, lod=True):
+        """Create the spec camera (or a sweep view) and make it the scene camera"""
+        camera_spec = camera_spec if camera_spec is not None else self.spec['camera']
+        print("📷 [Camera] Creating...")
+        name = camera_spec.get('name', 'Camera')
+        rotation = radians(camera_spec['rotation'])
+        settings = {k: v for k, v in camera_spec.items() if k not in ('name', 'location', 'rotation')}
+
+        def create():
+            camera = self.builder.add_camera(name, camera_spec['location'], rotation)
+            apply_settings(camera.data, settings, "Camera")
+            return camera
+
+        def update(camera):
+            if camera.type != 'CAMERA':
+                return False
+            self.set_transform(camera, camera_spec['location'], rotation)
+            apply_settings(camera.data, settings, "Camera")
+            return True
+
+        camera = self.sync(name, item_digest(camera_spec), create, update)
+        bpy.context.scene.camera = camera
+        print("✅ Camera positioned.")
+        if lod and self.spec.get('lod', True):
+            apply_lod(self.builder, cameras=[camera])
+        return camera
+
+    # ----------------------------------------
+    # ENVIRONMENT
+    # ----------------------------------------
+    def add_object(self, obj_spec, group=None):
+        primitive = obj_spec['primitive']
+        segments = obj_spec.get('segments', 32)
+        scale = obj_spec.get('scale', (1, 1, 1))
+        rotation = radians(obj_spec.get('rotation', (0, 0, 0)))
+        material = self.materials.get(obj_spec.get('material'))
+
+        def create():
+            return self.builder.add_pooled_primitive(primitive, obj_spec['location'], scale=scale, rotation=rotation,
+                                                     material=material, name=obj_spec['name'], segments=segments)
+
+        def update(obj):
+            if obj.type != 'MESH':
+                return False
+            # Swapping in another pooled mesh is enough when the primitive or segment count changed
+            obj.data = self.builder.pooled_mesh(primitive, segments)
+            obj["primitive"] = primitive
+            obj["segments"] = segments if primitive in ('cylinder', 'sphere') else 0
+            self.set_transform(obj, obj_spec['location'], rotation, scale)
+            self.builder.set_object_material(obj, material)
+            return True
+
+        digest = item_digest(obj_spec, group, self.material_spec(obj_spec.get('material')))
+        obj = self.sync(obj_spec['name'], digest, create, update)
+        if group:
+            obj["group"] = group
+        return obj
+
+    def build_environment(self):
+        print("🌊 [Environment] Building...")
+        for group, objects in self.spec.get('environment', {}).items():
+            for obj_spec in objects:
+                self.add_object(obj_spec, group)
+            print(f"   {group}: {len(objects)} objects")
+        print("✅ Environment built.")
+
+    def build_scatter(self):
+        """Seeded vegetation and rock instances drawn from shared prototypes"""
+        if not self.spec.get('scatter'):
+            return
+        print("🌿 [Scatter] Instancing...")
+        Scatterer(self).build()
+
+    # ----------------------------------------
+    # CHARACTERS
+    # ----------------------------------------
+    def get_font_path(self, font_name):
+        font_file = FONT_FILES.get(font_name, 'impact.ttf')
+        return os.path.join(FONT_DIR, font_file)
+
+    def build_character_rig(self):
+        """Build the eyes, pupils, mouth and limbs once and share them across letters"""
+        if self.character_rig is not None:
+            return self.character_rig
+
+        rig_parts = self.spec['characters'].get('rig', [])
+        digest = self.rig_digest()
+        existing = bpy.data.collections.get("CharacterRig")
+        if existing is not None and self.incremental:
+            if existing.get("spec_digest") == digest:
+                self.character_rig = existing
+                return existing
+            self.builder.remove_collection(existing)
+
+        print("🦴 [Rig] Building shared character rig...")
+        rig = self.builder.template_builder("CharacterRig")
+        rig.collection["spec_digest"] = digest
+        for part in rig_parts:
+            rig.add_primitive(part['primitive'], part['offset'], scale=part.get('scale', (1, 1, 1)),
+                              rotation=radians(part.get('rotation', (0, 0, 0))),
+                              material=self.materials.get(part['material']), name=f"Rig_{part['part']}",
+                              **part.get('dims', {}))
+
+        self.character_rig = rig.collection
+        print("✅ Character rig built.")
+        return self.character_rig
+
+    def rig_digest(self):
+        rig_parts = self.spec['characters'].get('rig', [])
+        return item_digest(rig_parts, [self.material_spec(part['material']) for part in rig_parts])
+
+    def create_character(self, letter_spec):
+        letter = letter_spec['letter']
+        pos = letter_spec['location']
+        characters = self.spec['characters']
+        material = self.materials.get(letter_spec.get('material'))
+        print(f"🎭 [Character] Creating {letter}...")
+
+        # Create main letter body (cached letter mesh, font loaded once)
+        font_path = self.get_font_path(characters.get('font', 'Impact'))
+
+        def body_mesh():
+            return self.letter_cache.get_mesh(font_path, letter, **characters.get('body', {}))
+
+        def update_body(obj):
+            if obj.type != 'MESH':
+                return False
+            obj.data = body_mesh()
+            self.set_transform(obj, pos)
+            self.builder.set_object_material(obj, material)
+            return True
+
+        body_digest = item_digest(letter_spec, characters.get('font'), characters.get('body'),
+                                  self.material_spec(letter_spec.get('material')))
+        self.sync(f"{letter}_Body", body_digest,
+                  lambda: self.builder.add_shared_object(f"{letter}_Body", body_mesh(), pos, material=material),
+                  update_body)
+
+        # Place the shared rig (eyes, pupils, mouth, limbs) as a collection instance
+        if characters.get('rig'):
+            def update_rig(obj):
+                if obj.type != 'EMPTY':
+                    return False
+                self.set_transform(obj, pos)
+                obj.instance_collection = self.build_character_rig()
+                return True
+
+            self.sync(f"{letter}_Rig", item_digest(pos, self.rig_digest()),
+                      lambda: self.builder.add_collection_instance(f"{letter}_Rig", self.build_character_rig(), pos),
+                      update_rig)
+
+        print(f"✅ Character {letter} created.")
+
+    def create_characters(self):
+        characters = self.spec.get('characters')
+        if not characters:
+            return
+        letters = characters.get('letters', [])
+        print(f"🎭 [Characters] Creating {', '.join(c['letter'] for c in letters)}...")
+        for letter_spec in letters:
+            self.create_character(letter_spec)
+        self.letter_cache.report()
+        print("✅ Characters created.")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Scene Specification
+Load, save and hash the declarative JSON scene specs compiled by scene_compiler.py
+"""
+
+import copy
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SPEC_DIR = os.path.join(SCRIPT_DIR, "scene_specs")
+
+# Any change to these modules changes what a spec builds
+BUILDER_MODULES = ('scene_spec.py', 'scene_compiler.py', 'scene_builder.py', 'material_registry.py',
+                   'letter_cache.py', 'scatter.py', 'lod.py')
+
+
+def spec_path(name):
+    """Path of a named preset in scene_specs/, or the given path if it already points at a file"""
+    if name.endswith(".json") or os.sep in name or "/" in name:
+        return name
+    return os.path.join(SPEC_DIR, f"{name}.json")
+
+
+def resolve_path(path):
+    """Spec paths are relative to the ALPHABET-PYTHON directory"""
+    return path if os.path.isabs(path) else os.path.join(SCRIPT_DIR, path)
+
+
+def spec_output(spec):
+    """Resolved output path; None for sweep specs, whose views each pass their own"""
+    return resolve_path(spec['output']) if spec.get('output') else None
+
+
+def load_spec(name):
+    with open(spec_path(name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_spec(spec, name):
+    path = spec_path(name)
+    with atomic_write(path) as temp_path:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(format_spec(spec) + "\n")
+    return path
+
+
+def temp_path_for(path):
+    """Per-process temp name beside path; the extension is kept so Blender still picks the file format from it"""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{os.getpid()}.tmp{ext}"
+
+
+@contextmanager
+def atomic_write(path):
+    """Yield a temp path to write, then rename it over path, so readers in other processes never see half a file"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = temp_path_for(path)
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def save_json(path, data):
+    with atomic_write(path) as temp_path:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+
+def format_spec(value, indent=0):
+    """JSON with one line per object, light and rig part so specs diff cleanly"""
+    pad = "  " * indent
+    inline = json.dumps(value, ensure_ascii=False)
+    if isinstance(value, dict) and value and (len(inline) > 100 or any(isinstance(v, dict) for v in value.values())):
+        items = [f"{pad}  {json.dumps(k)}: {format_spec(v, indent + 1)}" for k, v in value.items()]
+        return "{\n" + ",\n".join(items) + f"\n{pad}}}"
+    if isinstance(value, list) and any(isinstance(v, dict) for v in value):
+        items = [f"{pad}  {json.dumps(v, ensure_ascii=False)}" for v in value]
+        return "[\n" + ",\n".join(items) + f"\n{pad}]"
+    return inline
+
+
+# Sections that do not reach the image; the camera is keyed separately so sweep views share the scene part
+UNRENDERED_SECTIONS = ('name', 'title', 'output', 'views', 'camera')
+
+
+def spec_hash(spec, sections=None, exclude=()):
+    """Stable digest of the whole spec, or of selected sections"""
+    keys = sections if sections is not None else sorted(spec)
+    data = {k: spec.get(k) for k in keys if k not in exclude}
+    payload = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def source_digest(modules):
+    """Digest of script sources next to this module; changes whenever their code does"""
+    digest = hashlib.sha1()
+    for module in modules:
+        with open(os.path.join(SCRIPT_DIR, module), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def item_digest(*parts):
+    """Short digest of one spec entry, stored on the object it builds"""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def view_camera(spec, view, name=None):
+    """Camera section for one sweep view, on top of the spec's camera or camera_defaults"""
+    camera = copy.deepcopy(spec.get('camera') or spec.get('camera_defaults', {}))
+    camera.update({
+        'name': name or camera.get('name', 'Camera'),
+        'location': list(view['location']),
+        'rotation': list(view['rotation']),
+        'lens': view.get('lens', camera.get('lens', 50)),
+    })
+    camera['dof'] = dict(camera.get('dof', {}), focus_distance=view.get('focus_distance', 50.0))
+    return camera
+
+
+def with_camera(spec, view):
+    """Copy of a spec with its camera replaced by a sweep view"""
+    spec = copy.deepcopy(spec)
+    spec['camera'] = view_camera(spec, view)
+    return spec
+
+
+def find_view(spec, name):
+    for view in spec.get('views', []):
+        if view['name'] == name:
+            return view
+    return None
+
+
+def context_cameras(spec, views):
+    """Camera sections of the spec's other sweep views; a shard's LOD and settings are fit across them too"""
+    names = {view['name'] for view in views}
+    return [view_camera(spec, view, name=f"Camera_{view['name']}") for view in spec.get('views', [])
+            if view['name'] not in names]
+
+
+def job_camera(spec, job):
+    """Camera section for a render job's 'camera' or 'view'; the spec's own camera when it names neither"""
+    if job.get('camera'):
+        return dict(job['camera'], name=job['camera'].get('name', "Camera_Worker"))
+    if job.get('view'):
+        view = find_view(spec, job['view'])
+        if view is None:
+            raise ValueError(f"Unknown view '{job['view']}' in spec '{spec['name']}'")
+        return view_camera(spec, view, name=f"Camera_{view['name']}")
+    return spec.get('camera')
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Sweep Manifest
+Maps the numbered frames of an animated camera sweep back to the view names they show
+"""
+
+import json
+import os
+import re
+
+from scene_spec import save_json
+
+MANIFEST_NAME = "manifest.json"
+
+
+def frame_output(pattern, frame):
+    """Path Blender writes for one frame: the run of '#' becomes the zero-padded frame number"""
+    return re.sub(r'#+', lambda run: f"{frame:0{len(run.group())}d}", pattern, count=1)
+
+
+def manifest_path(output_dir, name=MANIFEST_NAME):
+    return os.path.join(output_dir, name)
+
+
+def shard_manifest_name(index):
+    return f"manifest.shard{index}.json"
+
+
+def load_manifest(output_dir, name=MANIFEST_NAME):
+    path = manifest_path(output_dir, name)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_manifest(output_dir, spec, views, shots, timings, tier, name=MANIFEST_NAME):
+    """Record frame, view name and file for every shot; shots missing from the timings failed to write"""
+    timed = {timing['path']: timing for timing in timings}
+    frames = []
+    for view, (_, output_path, frame) in zip(views, shots):
+        timing = timed.get(output_path)
+        frames.append({'frame': frame, 'name': view['name'], 'file': os.path.basename(output_path),
+                       'cached': bool(timing and timing.get('cached')), 'failed': timing is None,
+                       'seconds': timing['seconds'] if timing else None})
+    manifest = {'spec': spec['name'], 'tier': tier, 'frames': frames}
+    save_json(manifest_path(output_dir, name), manifest)
+    return manifest
+
+
+def merge_manifests(output_dir, shard_count, shards=None):
+    """Combine shard manifests into manifest.json in frame order; None if any shard manifest is missing"""
+    manifests = [load_manifest(output_dir, shard_manifest_name(i)) for i in range(shard_count)]
+    if any(manifest is None for manifest in manifests):
+        return None
+    merged = dict(manifests[0], frames=sorted((entry for m in manifests for entry in m['frames']),
+                                              key=lambda entry: entry['frame']))
+    if shards is not None:
+        merged['shards'] = shards
+    save_json(manifest_path(output_dir), merged)
+    for i in range(shard_count):
+        os.remove(manifest_path(output_dir, shard_manifest_name(i)))
+    return merged
+
+
+def sweep_renders(output_dir, prefix):
+    """(view name, path) pairs from the manifest; sweeps rendered before manifests fall back to file names"""
+    manifest = load_manifest(output_dir)
+    if manifest is not None:
+        # A failed frame's path may still hold an earlier run's image
+        return [(entry['name'], os.path.join(output_dir, entry['file'])) for entry in manifest['frames']
+                if not entry.get('failed') and os.path.exists(os.path.join(output_dir, entry['file']))]
+    return [(name[len(prefix):-len('.png')], os.path.join(output_dir, name))
+            for name in sorted(os.listdir(output_dir)) if name.startswith(prefix) and name.endswith('.png')]
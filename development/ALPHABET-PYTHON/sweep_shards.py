@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Sweep Shards
+Splits a camera sweep across parallel headless Blender processes and merges their frames, manifests and logs
+
+    python sweep_shards.py camera_test --shards 4 --tier draft
+"""
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from quality_tiers import DEFAULT_TIER
+from render_pool import SWEEP_DIRS, blender_binary, option
+from scene_spec import SCRIPT_DIR, load_spec
+from sweep_manifest import MANIFEST_NAME, manifest_path, merge_manifests, shard_manifest_name
+
+# Sweep spec -> the script that renders it
+SWEEP_SCRIPTS = {'camera_test': "camera_test_script.py", 'framing_test': "camera_framing_analyzer.py"}
+
+# Per attempt; the old single-process sweep had 300 s for every camera together
+SHARD_TIMEOUT = 600
+
+# A failed shard is re-run on its own this many times
+RETRIES = 1
+
+# Every shard pays for its own scene load; beyond this the 8-14 view sweeps gain little (override with --shards)
+MAX_DEFAULT_SHARDS = 4
+
+
+def shard_views(views, count):
+    """Contiguous, near-equal slices, so each shard's frames render as one animation run"""
+    count = max(1, min(count, len(views)))
+    size, extra = divmod(len(views), count)
+    shards, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        shards.append(views[start:end])
+        start = end
+    return shards
+
+
+def threads_per_shard(count):
+    """Split the cores between shards; every Blender defaulting to all of them oversubscribes the CPU"""
+    return max(1, (os.cpu_count() or 1) // max(count, 1))
+
+
+def default_shard_count():
+    return max(1, min(os.cpu_count() or 1, MAX_DEFAULT_SHARDS))
+
+
+class SweepShard:
+    def __init__(self, index, views, log_path):
+        self.index = index
+        self.views = views
+        self.log_path = log_path
+        self.attempts = 0
+        self.seconds = 0.0
+        self.error = None
+
+    def command(self, blender_path, script, tier, threads):
+        # Without --python-exit-code a script exception still exits 0
+        return [blender_path, "--background", "--threads", str(threads), "--python-exit-code", "1",
+                "--python", os.path.join(SCRIPT_DIR, script), "--",
+                "--views", ",".join(view['name'] for view in self.views),
+                "--manifest", shard_manifest_name(self.index), "--tier", tier]
+
+    def run(self, blender_path, script, tier, threads, output_dir, timeout=SHARD_TIMEOUT):
+        """One attempt; True when Blender exited cleanly and left the shard's manifest behind"""
+        self.attempts += 1
+        start = time.perf_counter()
+        with open(self.log_path, 'a', encoding='utf-8') as log:
+            log.write(f"===== shard {self.index}, attempt {self.attempts}: "
+                      f"{', '.join(view['name'] for view in self.views)}\n")
+            log.flush()
+            try:
+                result = subprocess.run(self.command(blender_path, script, tier, threads), stdout=log,
+                                        stderr=subprocess.STDOUT, timeout=timeout)
+                self.error = None if result.returncode == 0 else f"exit code {result.returncode}"
+            except subprocess.TimeoutExpired:
+                self.error = f"timed out after {timeout}s"
+        self.seconds = time.perf_counter() - start
+        if self.error is None and not os.path.exists(manifest_path(output_dir, shard_manifest_name(self.index))):
+            self.error = "no shard manifest written"
+        return self.error is None
+
+    def summary(self):
+        return {'shard': self.index, 'views': [view['name'] for view in self.views], 'attempts': self.attempts,
+                'seconds': round(self.seconds, 2), 'error': self.error, 'log': os.path.basename(self.log_path)}
+
+
+def merge_logs(log_paths, merged_path):
+    with open(merged_path, 'w', encoding='utf-8') as merged:
+        for path in log_paths:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8', errors='replace') as log:
+                    merged.write(log.read())
+
+
+def run_sharded_sweep(blender_path, spec_name="camera_test", shards=None, tier=DEFAULT_TIER,
+                      timeout=SHARD_TIMEOUT, retries=RETRIES):
+    """Render a sweep spec's views across shard processes; True when every shard finished"""
+    views = load_spec(spec_name)['views']
+    output_dir = os.path.join(SCRIPT_DIR, "references_and_renders", SWEEP_DIRS[spec_name])
+    log_dir = os.path.join(output_dir, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+
+    slices = shard_views(views, shards or default_shard_count())
+    threads = threads_per_shard(len(slices))
+    work = [SweepShard(i, shard, os.path.join(log_dir, f"shard_{i}.log")) for i, shard in enumerate(slices)]
+    for shard in work:
+        # Stale shard output from an earlier run must not pass for this one
+        for path in (shard.log_path, manifest_path(output_dir, shard_manifest_name(shard.index))):
+            if os.path.exists(path):
+                os.remove(path)
+
+    script = SWEEP_SCRIPTS[spec_name]
+    print(f"🧩 [Shards] {len(views)} views of {spec_name} across {len(work)} Blender processes, "
+          f"{threads} threads each")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(len(work)) as executor:
+        ok = list(executor.map(lambda shard: shard.run(blender_path, script, tier, threads, output_dir, timeout),
+                               work))
+    for _ in range(retries):
+        failed = [shard for shard, done in zip(work, ok) if not done]
+        if not failed:
+            break
+        for shard in failed:
+            print(f"🔁 [Shards] Retrying shard {shard.index} ({shard.error})")
+            # Alone, it may use every core
+            ok[shard.index] = shard.run(blender_path, script, tier, threads_per_shard(1), output_dir, timeout)
+    wall = time.perf_counter() - start
+
+    merge_logs([shard.log_path for shard in work], os.path.join(output_dir, "sweep.log"))
+    for shard in work:
+        status = "✅" if shard.error is None else f"❌ {shard.error}"
+        print(f"   shard {shard.index}: {len(shard.views)} views, {shard.seconds:.1f}s, "
+              f"{shard.attempts} attempt(s) {status}")
+    if not all(ok):
+        print(f"❌ {sum(not done for done in ok)} shard(s) failed; see {os.path.join(output_dir, 'sweep.log')}")
+        return False
+
+    merged = merge_manifests(output_dir, len(work), shards=[shard.summary() for shard in work])
+    rendered = sum(entry['seconds'] or 0.0 for entry in merged['frames'])
+    print(f"✅ {len(merged['frames'])} views in {wall:.1f}s wall time ({rendered:.1f}s of frame renders), "
+          f"{os.path.join(output_dir, MANIFEST_NAME)}")
+    return True
+
+
+def main():
+    args = sys.argv[1:]
+    spec_name = args[0] if args and not args[0].startswith('--') else "camera_test"
+    blender_path = blender_binary()
+    if not blender_path:
+        print("❌ Blender not found; set $BLENDER or put blender on PATH")
+        sys.exit(1)
+    shards = option(args, '--shards')
+    ok = run_sharded_sweep(blender_path, spec_name, int(shards) if shards else None,
+                           option(args, '--tier', DEFAULT_TIER), int(option(args, '--timeout', SHARD_TIMEOUT)))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
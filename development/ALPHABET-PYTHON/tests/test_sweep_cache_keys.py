@@ -0,0 +1,56 @@
+"""
+Sweep render cache keys: a sweep split into a different number of shards must hit the frames it cached before
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from render_cache import render_key, steering_key
+from scene_spec import context_cameras, job_camera, load_spec, view_camera
+from sweep_shards import shard_views
+
+BLENDER = "4.1.0"
+TIER = 'draft'
+# Stands in for resolved_state(): Blender resolves the same LOD and settings from the same steering cameras
+STATE = "resolved"
+
+
+def sweep_keys(spec, shard_count):
+    """{view name: key} for one sharding, plus the steering key each shard looks its resolved state up under"""
+    keys, steering = {}, set()
+    for views in shard_views(spec['views'], shard_count):
+        cameras = [view_camera(spec, view, name=f"Camera_{view['name']}") for view in views]
+        steering.add(steering_key(spec, cameras + context_cameras(spec, views), TIER, BLENDER))
+        for view, camera in zip(views, cameras):
+            keys[view['name']] = render_key(spec, camera, TIER, BLENDER, state=STATE)
+    return keys, steering
+
+
+def test_resharded_sweep_hits_cache():
+    for name in ("camera_test", "framing_test"):
+        spec = load_spec(name)
+        cached, cached_steering = sweep_keys(spec, 1)
+        for shard_count in range(2, len(spec['views']) + 1):
+            keys, steering = sweep_keys(spec, shard_count)
+            assert steering == cached_steering, (name, shard_count)
+            assert keys == cached, (name, shard_count)
+
+
+def test_steering_key_ignores_order_and_names():
+    spec = load_spec("camera_test")
+    cameras = [view_camera(spec, view) for view in spec['views']]
+    renamed = [dict(camera, name=f"Other_{i}") for i, camera in enumerate(reversed(cameras))]
+    assert steering_key(spec, cameras, TIER, BLENDER) == steering_key(spec, renamed, TIER, BLENDER)
+    assert steering_key(spec, cameras, TIER, BLENDER) != steering_key(spec, cameras[1:], TIER, BLENDER)
+
+
+def test_pool_view_jobs_share_sweep_keys():
+    """RenderPool.job_key keys a view job on the whole sweep's steering cameras, like a one-view shard"""
+    spec = load_spec("camera_test")
+    cached, (cached_steering,) = sweep_keys(spec, 1)
+    for view in spec['views']:
+        camera = job_camera(spec, {'view': view['name']})
+        steering = steering_key(spec, [camera] + context_cameras(spec, [view]), TIER, BLENDER)
+        assert steering == cached_steering, view['name']
+        assert render_key(spec, camera, TIER, BLENDER, state=STATE) == cached[view['name']], view['name']